@@ -0,0 +1,548 @@
+"""Contains tests for the vectorised unreinforced clay masonry calculations"""
+
+import itertools
+import numpy as np
+import pytest
+import toms_structures.unreinforced_masonry as unreinforced_masonry
+from toms_structures import _kernels, batch
+
+
+class TestBatchFm:
+    """Tests that batch.fm matches the scalar calculation exactly"""
+
+    def test_matches_scalar(self):
+        """Sweep of fuc, mortar class, unit height and joint thickness"""
+        cases = list(
+            itertools.product(
+                [5, 10, 15, 20, 32],
+                [(2, True), (3, True), (4, True), (3, False)],
+                [76, 90, 162],
+                [8, 10],
+            )
+        )
+        expected = []
+        km = []
+        for fuc, (mortar_class, bedding_type), hu, tj in cases:
+            wall = unreinforced_masonry.Clay(
+                length=1000,
+                height=1000,
+                thickness=110,
+                fuc=fuc,
+                mortar_class=mortar_class,
+                bedding_type=bedding_type,
+                hu=hu,
+                tj=tj,
+                verbose=False,
+            )
+            km.append(wall._calc_km(verbose=False))
+            wall.basic_compressive_capacity(verbose=False)
+            expected.append(wall.fm)
+        fuc, _, hu, tj = (np.array(c) for c in zip(*cases))
+        _, _, fm = batch.fm(fuc=fuc, km=np.array(km), hu=hu, tj=tj)
+        assert fm.tolist() == expected
+
+
+class TestBatchCompressionCapacity:
+    """Tests that batch.compression_capacity matches the scalar method exactly"""
+
+    def test_matches_scalar(self):
+        """Sweep of heights, thicknesses, av and load types"""
+        cases = list(
+            itertools.product(
+                [1000, 2400, 2700, 3000],
+                [90, 110, 230],
+                [1, 2.5],
+                [1, 2, 3],
+            )
+        )
+        height, thickness, simple_av, load_type = (np.array(c) for c in zip(*cases))
+        basic = []
+        expected = []
+        for h, t, av, lt in cases:
+            wall = unreinforced_masonry.Clay(
+                length=1000,
+                height=h,
+                thickness=t,
+                fuc=20,
+                mortar_class=3,
+                bedding_type=True,
+            )
+            basic.append(wall.basic_compressive_capacity(verbose=False))
+            try:
+                expected.append(
+                    wall.compression_capacity(
+                        simple_av=av, kt=1, compression_load_type=lt, verbose=False
+                    )["Simple"]
+                )
+            except ValueError:
+                expected.append(None)
+        valid = np.array([e is not None for e in expected])
+        result = batch.compression_capacity(
+            basic_comp_cap=np.array(basic)[valid],
+            height=height[valid],
+            thickness=thickness[valid],
+            simple_av=simple_av[valid],
+            kt=1,
+            compression_load_type=load_type[valid],
+        )
+        assert result.tolist() == [e for e in expected if e is not None]
+
+    def test_invalid_load_type(self):
+        """raises ValueError for a load type outside 1, 2 or 3"""
+        with pytest.raises(ValueError):
+            batch.compression_capacity(
+                basic_comp_cap=406.5,
+                height=[1000, 2000],
+                thickness=110,
+                simple_av=1,
+                kt=1,
+                compression_load_type=[1, 4],
+            )
+
+    def test_non_integer_load_type(self):
+        """raises ValueError rather than truncating a load type of 1.5 to 1"""
+        with pytest.raises(ValueError):
+            batch.compression_capacity(
+                basic_comp_cap=406.5,
+                height=[1000, 2000],
+                thickness=110,
+                simple_av=1,
+                kt=1,
+                compression_load_type=[1, 1.5],
+            )
+
+
+class TestBatchEffectiveCompressionLength:
+    """Tests that batch.effective_compression_length matches the scalar method exactly"""
+
+    def test_matches_scalar(self):
+        """Sweep of wall sizes, bearing lengths and distances to the wall end"""
+        cases = list(
+            itertools.product(
+                [500, 1000, 3000], [1000, 2700], [100, 250], [0, 150, 400]
+            )
+        )
+        expected = [
+            unreinforced_masonry.Clay(
+                length=length,
+                height=height,
+                thickness=110,
+                fuc=20,
+                mortar_class=3,
+                bedding_type=True,
+                verbose=False,
+            )._calc_effective_compression_length(
+                bearing_length=bearing_length, dist_to_end=dist_to_end, verbose=False
+            )
+            for length, height, bearing_length, dist_to_end in cases
+        ]
+        length, height, bearing_length, dist_to_end = (np.array(c) for c in zip(*cases))
+        result = batch.effective_compression_length(
+            length=length,
+            height=height,
+            bearing_length=bearing_length,
+            dist_to_end=dist_to_end,
+        )
+        assert result.tolist() == expected
+
+
+class TestBatchRefinedCompression:
+    """Tests that batch.refined_compression matches the scalar method exactly"""
+
+    def test_matches_scalar(self):
+        """Sweep of heights, eccentricities and lateral support conditions"""
+        cases = list(
+            itertools.product(
+                [1000, 2700, 3000],
+                [(0, 0), (30, 30), (30, -30), (10, 5)],
+                [0.75, 1],
+                [(0, np.nan), (1, 3000), (2.5, 1500)],
+            )
+        )
+        crushing = []
+        buckling = []
+        basic = []
+        for h, (e1, e2), av, (ah, dist) in cases:
+            wall = unreinforced_masonry.Clay(
+                length=1000,
+                height=h,
+                thickness=110,
+                fuc=20,
+                mortar_class=3,
+                bedding_type=True,
+            )
+            basic.append(wall.basic_compressive_capacity(verbose=False))
+            capacity = wall.refined_compression(
+                refined_av=av,
+                refined_ah=ah,
+                kt=1,
+                e1=e1,
+                e2=e2,
+                dist_to_return=None if ah == 0 else dist,
+                verbose=False,
+            )
+            crushing.append(capacity["Crushing"])
+            buckling.append(capacity["Buckling"])
+        height, eccentricity, refined_av, support = zip(*cases)
+        e1, e2 = zip(*eccentricity)
+        refined_ah, dist_to_return = zip(*support)
+        result = batch.refined_compression(
+            basic_comp_cap=np.array(basic),
+            length=1000,
+            height=np.array(height),
+            thickness=110,
+            refined_av=np.array(refined_av),
+            refined_ah=np.array(refined_ah),
+            kt=1,
+            e1=np.array(e1),
+            e2=np.array(e2),
+            dist_to_return=np.array(dist_to_return),
+        )
+        assert result["Crushing"].tolist() == crushing
+        assert result["Buckling"].tolist() == buckling
+
+    def test_e2_exceeds_e1(self):
+        """raises ValueError when e1 < e2"""
+        with pytest.raises(ValueError):
+            batch.refined_compression(
+                basic_comp_cap=406.5,
+                length=1000,
+                height=2700,
+                thickness=100,
+                refined_av=1,
+                refined_ah=0,
+                kt=1,
+                e1=[10, 5],
+                e2=[5, 10],
+            )
+
+
+class TestJitRefinedKLateral:
+    """Tests that the numba compiled k for lateral instability kernel is
+    bit-identical to the plain Python function it is compiled from"""
+
+    def test_scalars_match_python(self):
+        pytest.importorskip("numba")
+        kernel = _kernels.refined_k_lateral
+        rng = np.random.default_rng(0)
+        for e1, e2, sr, thickness in rng.uniform(
+            [1, -50, 0, 50], [60, 60, 40, 300], size=(2000, 4)
+        ):
+            assert kernel(e1, e2, sr, thickness) == kernel.py_func(
+                e1, e2, sr, thickness
+            )
+        # integer arguments compile to a separate specialisation
+        assert kernel(10, 5, 27, 110) == kernel.py_func(10, 5, 27, 110)
+
+    def test_batch_arrays_match_python(self):
+        """batch passes flat float64 arrays, broadcast from mixed inputs"""
+        pytest.importorskip("numba")
+        kernel = _kernels.refined_k_lateral
+        rng = np.random.default_rng(1)
+        e1 = rng.uniform(1, 60, 500)
+        e2 = rng.uniform(-50, 60, 500)
+        sr = rng.uniform(0, 40, 500)
+        thickness = np.full(500, 110.0)
+        compiled = kernel(e1, e2, sr, thickness)
+        expected = [kernel.py_func(*values) for values in zip(e1, e2, sr, thickness)]
+        assert compiled.tolist() == expected
+        result = batch.refined_k_lateral(e1=e1, e2=e2, sr=sr, thickness=110)
+        assert result.tolist() == [
+            float(batch._round_half_up(max(value, 0), 2)) for value in expected
+        ]
+
+
+class TestBatchRefinedSlenderness:
+    """Tests that batch.refined_slenderness and batch.refined_k_lateral match
+    the scalar methods exactly"""
+
+    def test_matches_scalar(self):
+        """Sweep of heights, support conditions and eccentricities"""
+        cases = list(
+            itertools.product(
+                [1000, 2700, 3600],
+                [0.75, 1, 2.5],
+                [(0, np.nan), (1, 3000), (2.5, 1500)],
+                [(5.5, 5.5), (30, -30)],
+            )
+        )
+        expected_sr = []
+        expected_k = []
+        for height, refined_av, (refined_ah, dist), (e1, e2) in cases:
+            wall = unreinforced_masonry.Clay(
+                length=1000,
+                height=height,
+                thickness=110,
+                fuc=20,
+                mortar_class=3,
+                bedding_type=True,
+                verbose=False,
+            )
+            sr_vertical, sr_horizontal = wall._calc_refined_slenderness(
+                refined_av=refined_av,
+                refined_ah=refined_ah,
+                kt=1,
+                dist_to_return=None if refined_ah == 0 else dist,
+                verbose=False,
+            )
+            expected_sr.append((sr_vertical, sr_horizontal))
+            expected_k.append(
+                wall._calc_refined_k_lateral(
+                    e1=e1, e2=e2, sr=sr_horizontal, verbose=False
+                )
+            )
+        height, refined_av, support, eccentricity = zip(*cases)
+        refined_ah, dist_to_return = zip(*support)
+        e1, e2 = zip(*eccentricity)
+        sr_vertical, sr_horizontal = batch.refined_slenderness(
+            height=np.array(height),
+            thickness=110,
+            refined_av=np.array(refined_av),
+            refined_ah=np.array(refined_ah),
+            kt=1,
+            dist_to_return=np.array(dist_to_return),
+        )
+        assert sr_vertical.tolist() == [sr for sr, _ in expected_sr]
+        assert [None if np.isnan(sr) else sr for sr in sr_horizontal.tolist()] == [
+            sr for _, sr in expected_sr
+        ]
+        k_lateral = batch.refined_k_lateral(
+            e1=np.array(e1), e2=np.array(e2), sr=sr_horizontal, thickness=110
+        )
+        assert k_lateral.tolist() == expected_k
+
+    def test_missing_dist_to_return(self):
+        """raises ValueError when dist_to_return is not set for a supported edge"""
+        with pytest.raises(ValueError):
+            batch.refined_slenderness(
+                height=[2700, 2700],
+                thickness=110,
+                refined_av=1,
+                refined_ah=[0, 1],
+                kt=1,
+            )
+
+    def test_dist_to_return_none(self):
+        """None is accepted for dist_to_return where no edge is supported, and
+        raises ValueError where one is"""
+        sr_vertical, sr_horizontal = batch.refined_slenderness(
+            height=2700,
+            thickness=110,
+            refined_av=1,
+            refined_ah=0,
+            kt=1,
+            dist_to_return=None,
+        )
+        assert sr_vertical.tolist() == 24.55
+        assert np.isnan(sr_horizontal)
+        with pytest.raises(ValueError):
+            batch.refined_slenderness(
+                height=[2700, 2700],
+                thickness=110,
+                refined_av=1,
+                refined_ah=[0, 1],
+                kt=1,
+                dist_to_return=[None, None],
+            )
+
+
+class TestBatchSelfWeight:
+    """Tests that batch.self_weight matches the scalar method exactly"""
+
+    def test_matches_scalar(self):
+        """Sweep of wall sizes"""
+        cases = list(itertools.product([1000, 2400], [1000, 2700], [90, 110, 230]))
+        expected = [
+            unreinforced_masonry.Clay(
+                length=length,
+                height=height,
+                thickness=thickness,
+                fuc=20,
+                mortar_class=3,
+                bedding_type=True,
+                verbose=False,
+            )._self_weight()
+            for length, height, thickness in cases
+        ]
+        length, height, thickness = (np.array(c) for c in zip(*cases))
+        result = batch.self_weight(
+            density=unreinforced_masonry.Clay._defaults["density"],
+            length=length,
+            height=height,
+            thickness=thickness,
+        )
+        assert result.tolist() == expected
+
+
+class TestClayBatch:
+    """Tests that ClayBatch matches Clay exactly wall by wall"""
+
+    cases = list(
+        itertools.product(
+            [1000, 2700],
+            [90, 110, 230],
+            [10, 20, 32],
+            [(2, True), (3, True), (4, True), (3, False)],
+            [0, 5],
+        )
+    )
+
+    def _walls(self):
+        return [
+            unreinforced_masonry.Clay(
+                length=1200,
+                height=height,
+                thickness=thickness,
+                fuc=fuc,
+                mortar_class=mortar_class,
+                bedding_type=bedding_type,
+                face_shell_thickness=25,
+                raking=raking,
+                verbose=False,
+            )
+            for height, thickness, fuc, (mortar_class, bedding_type), raking in (
+                self.cases
+            )
+        ]
+
+    def _batch(self):
+        height, thickness, fuc, mortar, raking = zip(*self.cases)
+        mortar_class, bedding_type = zip(*mortar)
+        return batch.ClayBatch(
+            length=1200,
+            height=np.array(height),
+            thickness=np.array(thickness),
+            fuc=np.array(fuc),
+            mortar_class=np.array(mortar_class),
+            bedding_type=np.array(bedding_type),
+            face_shell_thickness=25,
+            raking=np.array(raking),
+        )
+
+    def test_basic_compressive_capacity(self):
+        """Sweep of geometry, unit strength, mortar class, bedding and raking"""
+        expected = [
+            wall.basic_compressive_capacity(verbose=False) for wall in self._walls()
+        ]
+        assert self._batch().basic_compressive_capacity().tolist() == expected
+
+    def test_compression_capacity(self):
+        """Simplified method for a concrete slab supported along the top edge"""
+        expected = [
+            wall.compression_capacity(
+                simple_av=1, kt=1, compression_load_type=1, verbose=False
+            )["Simple"]
+            for wall in self._walls()
+        ]
+        result = self._batch().compression_capacity(
+            simple_av=1, kt=1, compression_load_type=1
+        )
+        assert result.tolist() == expected
+
+    def test_refined_compression(self):
+        """Refined method with a return wall 2000mm away"""
+        expected = [
+            wall.refined_compression(
+                refined_av=0.75,
+                refined_ah=2.5,
+                kt=1,
+                e1=10,
+                e2=5,
+                dist_to_return=2000,
+                verbose=False,
+            )
+            for wall in self._walls()
+        ]
+        result = self._batch().refined_compression(
+            refined_av=0.75, refined_ah=2.5, kt=1, e1=10, e2=5, dist_to_return=2000
+        )
+        assert result["Crushing"].tolist() == [e["Crushing"] for e in expected]
+        assert result["Buckling"].tolist() == [e["Buckling"] for e in expected]
+
+    def test_vertical_bending(self):
+        """Vertical bending with and without a masonry interface"""
+        for fd, interface in itertools.product([0, 0.1, 0.5], [True, False]):
+            expected = [
+                wall.vertical_bending(fd=fd, interface=interface, verbose=False)
+                for wall in self._walls()
+            ]
+            result = self._batch().vertical_bending(fd=fd, interface=interface)
+            assert result.tolist() == expected
+
+    def test_vertical_bending_interface_required(self):
+        """raises ValueError when interface is not set or not bool for any wall"""
+        for interface in [None, [True, None], [1, 0]]:
+            with pytest.raises(ValueError):
+                batch.ClayBatch(
+                    length=1000,
+                    height=2700,
+                    thickness=110,
+                    fuc=20,
+                    mortar_class=3,
+                    bedding_type=True,
+                ).vertical_bending(fd=0, interface=interface)
+
+    def test_horizontal_bending(self):
+        """Horizontal bending for a range of design compressive stresses"""
+        for fd in [0, 0.1, 0.5]:
+            expected = [
+                wall.horizontal_bending(fd=fd, interface=True, verbose=False)
+                for wall in self._walls()
+            ]
+            assert self._batch().horizontal_bending(fd=fd).tolist() == expected
+
+    def test_self_weight(self):
+        """Self weight of each wall"""
+        expected = [wall._self_weight() for wall in self._walls()]
+        assert self._batch().self_weight().tolist() == expected
+
+    def test_from_walls(self):
+        """A ClayBatch built from Clay walls matches each wall"""
+        walls = self._walls()
+        expected = [wall.basic_compressive_capacity(verbose=False) for wall in walls]
+        result = batch.ClayBatch.from_walls(walls).basic_compressive_capacity()
+        assert result.tolist() == expected
+
+    def test_from_walls_rejects_other_materials(self):
+        """raises TypeError for walls that are not Clay"""
+        walls = self._walls()
+        walls.append(
+            unreinforced_masonry.HollowConcrete(
+                length=1000,
+                height=2700,
+                thickness=190,
+                fuc=15,
+                mortar_class=3,
+                bedding_type=True,
+                verbose=False,
+            )
+        )
+        with pytest.raises(TypeError):
+            batch.ClayBatch.from_walls(walls)
+
+    def test_face_shell_bedding_mortar_class(self):
+        """raises ValueError for face shell bedding with a mortar class other than M3"""
+        walls = batch.ClayBatch(
+            length=1000,
+            height=2700,
+            thickness=110,
+            fuc=20,
+            mortar_class=[3, 4],
+            bedding_type=False,
+        )
+        with pytest.raises(ValueError):
+            walls.basic_compressive_capacity()
+
+    def test_bedding_type_required(self):
+        """raises ValueError when any bedding_type is None, as Clay does"""
+        with pytest.raises(ValueError):
+            batch.ClayBatch(
+                length=1000,
+                height=2700,
+                thickness=110,
+                fuc=20,
+                mortar_class=3,
+                bedding_type=[True, None],
+            )
+        with pytest.raises(ValueError):
+            batch.clay_km(bedding_type=None, mortar_class=3)
@@ -192,6 +192,24 @@ class TestBasicCompressiveCapacity:
         )
         assert wall.basic_compressive_capacity() == 610.5
 
+    @pytest.mark.parametrize(
+        "name",
+        ["hu", "tj", "lu", "face_shell_thickness", "raking", "fmt", "grouted", "fcg"],
+    )
+    def test_none_uses_class_default(self, name):
+        """An explicit None falls back to the Clay default, as in test_standard_m3_brick"""
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=1000,
+            thickness=110,
+            fuc=20,
+            mortar_class=3,
+            bedding_type=True,
+            **{name: None},
+        )
+        assert getattr(wall, name) == unreinforced_masonry.Clay._defaults[name]
+        assert wall.basic_compressive_capacity() == 516.45
+
 
 class TestSimplifiedCompression:
     """Tests wall compressive capacity based on the simplified method given in AS3700 Cl 7.3.3"""
@@ -479,6 +497,68 @@ class TestRefinedCompression:
         )
         assert capacity == {"Crushing": 365.85, "Buckling": 186.99}
 
+    def test_cached_capacity_follows_property_changes(self):
+        """
+        Fo = 406.5 KN, e1 = 30mm, e2 = -30mm, as in test_opposite_large_eccentricity
+        Sr = 1 * 3000 / (1 * 100) = 30, k = 0.5(0.82)(2)(1.18 - 0.03*30) = 0.23
+        Buckling capacity = 0.23 * 406.5 KN = 93.5 KN
+
+        After the height is changed to 2000mm:
+        Sr = 1 * 2000 / (1 * 100) = 20, k = 0.5(0.82)(2)(1.18 - 0.03*20) = 0.48
+        Buckling capacity = 0.48 * 406.5 KN = 195.12 KN
+        """
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=3000,
+            thickness=100,
+            fuc=15,
+            mortar_class=3,
+            bedding_type=True,
+            verbose=False,
+        )
+        for _ in range(2):
+            capacity = wall.refined_compression(
+                e1=30, e2=-30, refined_av=1, refined_ah=0, kt=1, verbose=False
+            )
+            assert capacity == {"Crushing": 162.6, "Buckling": 93.5}
+            capacity["Buckling"] = 0
+        wall.height = 2000
+        capacity = wall.refined_compression(
+            e1=30, e2=-30, refined_av=1, refined_ah=0, kt=1, verbose=False
+        )
+        assert capacity == {"Crushing": 162.6, "Buckling": 195.12}
+
+    def test_cache_is_bounded(self):
+        """An eccentricity sweep keeps at most 8 results cached, and a repeated
+        call returns an equal result that is independent of the first"""
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=3000,
+            thickness=100,
+            fuc=15,
+            mortar_class=3,
+            bedding_type=True,
+            verbose=False,
+        )
+        first = wall.refined_compression(
+            e1=30, e2=-30, refined_av=1, refined_ah=0, kt=1, verbose=False
+        )
+        for e1 in range(5, 50):
+            wall.refined_compression(
+                e1=e1, e2=0, refined_av=1, refined_ah=0, kt=1, verbose=False
+            )
+            assert len(wall._refined_comp_cache) <= 8
+        first["Buckling"] = 0
+        repeat = wall.refined_compression(
+            e1=30, e2=-30, refined_av=1, refined_ah=0, kt=1, verbose=False
+        )
+        assert repeat == {"Crushing": 162.6, "Buckling": 93.5}
+        assert repeat is not first
+        repeat["Buckling"] = 0
+        assert wall.refined_compression(
+            e1=30, e2=-30, refined_av=1, refined_ah=0, kt=1, verbose=False
+        ) == {"Crushing": 162.6, "Buckling": 93.5}
+
     def test_e2_exceeds_e1(self):
         """raises ValueError when e1 > e2"""
         with pytest.raises(ValueError):
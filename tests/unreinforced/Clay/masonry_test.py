@@ -1,6 +1,10 @@
 """Contains miscellaneous tests for unreinforced clay masonry"""
 
+import logging
+import threading
+import pytest
 import toms_structures.unreinforced_masonry as unreinforced_masonry
+from toms_structures import _util
 
 
 class TestBasicCompressiveCapacity:
@@ -25,6 +29,317 @@ class TestBasicCompressiveCapacity:
         capacity = wall.basic_compressive_capacity()
         assert capacity == 516.45
 
+    def test_cached_capacity_follows_property_changes(self):
+        """
+        Fo = 0.75 * 6.26 * 1000 * 110 = 516.45 KN
+        Fo = 0.75 * 6.26 * 1000 * 230 = 1079.85 KN after the thickness is changed
+        """
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=1000,
+            thickness=110,
+            fuc=20,
+            mortar_class=3,
+            bedding_type=True,
+            verbose=False,
+        )
+        assert wall.basic_compressive_capacity(verbose=False) == 516.45
+        assert wall.basic_compressive_capacity(verbose=False) == 516.45
+        wall.thickness = 230
+        assert wall.basic_compressive_capacity(verbose=False) == 1079.85
+
+    def test_cache_follows_a_sweep(self):
+        """A sweep over the thickness gives the same capacities as fresh walls,
+        and returning to the first thickness gives its capacity again"""
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=1000,
+            thickness=110,
+            fuc=20,
+            mortar_class=3,
+            bedding_type=True,
+            verbose=False,
+        )
+        for thickness in range(100, 300, 10):
+            wall.thickness = thickness
+            fresh = unreinforced_masonry.Clay(
+                length=1000,
+                height=1000,
+                thickness=thickness,
+                fuc=20,
+                mortar_class=3,
+                bedding_type=True,
+                verbose=False,
+            )
+            assert wall.basic_compressive_capacity(
+                verbose=False
+            ) == fresh.basic_compressive_capacity(verbose=False)
+        wall.thickness = 110
+        assert wall.basic_compressive_capacity(verbose=False) == 516.45
+        assert wall.basic_compressive_capacity(verbose=False) == 516.45
+
+    def test_fmb_rounds_half_up(self):
+        """
+        fmb = km * sqrt(fuc) = 2 * sqrt(47.3) = 13.754999 MPa, rounded half up to 13.76 MPa
+        (the builtin round gives 13.75 MPa)
+        fm = kh * fmb = 1 * 13.76 = 13.76 MPa
+        Fo = 0.75 * 13.76 * 1000 * 110 = 1135.2 KN
+        """
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=1000,
+            thickness=110,
+            fuc=47.3,
+            mortar_class=4,
+            bedding_type=True,
+            verbose=False,
+        )
+        assert wall.basic_compressive_capacity(verbose=False) == 1135.2
+
+    def test_bedding_type_required(self):
+        """raises ValueError when bedding_type is not provided"""
+        with pytest.raises(ValueError):
+            unreinforced_masonry.Clay(
+                length=1000,
+                height=1000,
+                thickness=110,
+                fuc=20,
+                mortar_class=3,
+            )
+
+
+class TestMaterialConstants:
+    def test_density_overridden_per_wall(self):
+        """
+        self weight = 19 * 1000 * 1000 * 110 = 2.09e9 by default
+        self weight = 22 * 1000 * 1000 * 110 = 2.42e9 once the density is changed
+        """
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=1000,
+            thickness=110,
+            fuc=20,
+            mortar_class=3,
+            bedding_type=True,
+            verbose=False,
+        )
+        other = unreinforced_masonry.Clay(
+            length=1000,
+            height=1000,
+            thickness=110,
+            fuc=20,
+            mortar_class=3,
+            bedding_type=True,
+            verbose=False,
+        )
+        assert wall._self_weight() == 2.09e9
+        wall.density = 22
+        assert wall._self_weight() == 2.42e9
+        assert other.density == 19
+
+    def test_dense_hollow_concrete_kc(self):
+        """kc = 1.2 for the default density of 19, and 1.4 once it exceeds 20,
+        refer AS3700 Cl 7.3.2
+        """
+        wall = unreinforced_masonry.HollowConcrete(
+            length=1000,
+            height=1000,
+            thickness=190,
+            fuc=15,
+            mortar_class=3,
+            bedding_type=True,
+            grouted=1,
+            fcg=20,
+            verbose=False,
+        )
+        assert wall._calc_kc() == 1.2
+        assert wall.basic_compressive_capacity(verbose=False) == 1273.92
+        wall.density = 22
+        assert wall._calc_kc() == 1.4
+        assert wall.basic_compressive_capacity(verbose=False) == 1352.29
+
+
+class TestVerbose:
+    def test_silent_when_not_verbose(self, capsys):
+        """Nothing is printed when verbose is False"""
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=2700,
+            thickness=110,
+            fuc=20,
+            mortar_class=3,
+            bedding_type=True,
+            verbose=False,
+        )
+        wall.refined_compression(
+            refined_av=1, refined_ah=0, kt=1, e1=10, e2=5, verbose=False
+        )
+        wall.refined_concentrated_load(
+            refined_av=1,
+            refined_ah=0,
+            kt=1,
+            e1=10,
+            e2=5,
+            dist_to_end=200,
+            bearing_width=110,
+            bearing_length=200,
+            verbose=False,
+        )
+        assert capsys.readouterr().out == ""
+
+    def test_silenced_by_log_level(self, capsys):
+        """verbose output is routed through the toms_structures logger, so raising
+        its level silences it"""
+        logger = logging.getLogger("toms_structures")
+        logger.setLevel(logging.WARNING)
+        try:
+            wall = unreinforced_masonry.Clay(
+                length=1000,
+                height=2700,
+                thickness=110,
+                fuc=20,
+                mortar_class=3,
+                bedding_type=True,
+            )
+            wall.basic_compressive_capacity(verbose=True)
+        finally:
+            logger.setLevel(logging.INFO)
+        assert capsys.readouterr().out == ""
+        wall.basic_compressive_capacity(verbose=True)
+        assert "basic_compressive_capacity = 516.45 KN" in capsys.readouterr().out
+
+    def test_records_formatted_lazily(self, caplog):
+        """Values are passed as logging arguments rather than pre-formatted"""
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=2700,
+            thickness=110,
+            fuc=20,
+            mortar_class=3,
+            bedding_type=True,
+            verbose=False,
+        )
+        logger = logging.getLogger("toms_structures")
+        logger.addHandler(caplog.handler)
+        try:
+            wall.basic_compressive_capacity(verbose=True)
+        finally:
+            logger.removeHandler(caplog.handler)
+        record = next(
+            record
+            for record in caplog.records
+            if record.getMessage().startswith("basic_compressive_capacity = ")
+        )
+        assert record.msg.startswith("basic_compressive_capacity = %s KN")
+        assert record.args == (516.45,)
+
+    def test_records_propagate(self):
+        """Records reach the application's handlers through the root logger"""
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=2700,
+            thickness=110,
+            fuc=20,
+            mortar_class=3,
+            bedding_type=True,
+            verbose=False,
+        )
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        root = logging.getLogger()
+        root.addHandler(handler)
+        try:
+            wall.basic_compressive_capacity(verbose=True)
+        finally:
+            root.removeHandler(handler)
+        assert any(
+            record.getMessage().startswith("basic_compressive_capacity = 516.45 KN")
+            for record in records
+        )
+
+    def test_handler_errors_reported(self, monkeypatch):
+        """A record that fails to print is passed to handleError instead of
+        raising into the calculation"""
+
+        def fail(*args):
+            raise OSError("stdout closed")
+
+        handled = []
+        monkeypatch.setattr(_util._print_handler, "handleError", handled.append)
+        monkeypatch.setattr("builtins.print", fail)
+        _util.logger.info("fm: %s MPa", 5.42)
+        assert [record.getMessage() for record in handled] == ["fm: 5.42 MPa"]
+
+    def test_report_printed_once(self, monkeypatch):
+        """The verbose output of a calculation, including the calculations it
+        calls internally, is printed with a single call"""
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=2700,
+            thickness=110,
+            fuc=20,
+            mortar_class=3,
+            bedding_type=True,
+            verbose=False,
+        )
+        printed = []
+        monkeypatch.setattr("builtins.print", printed.append)
+        wall.refined_compression(
+            refined_av=1, refined_ah=0, kt=1, e1=10, e2=5, verbose=True
+        )
+        assert len(printed) == 1
+        assert "Refined Compression Capacity" in printed[0]
+        assert "basic_compressive_capacity = " in printed[0]
+
+    def test_positional_verbose_skips_report(self, monkeypatch):
+        """Internal calls passing verbose=False by position are not buffered"""
+        wall = unreinforced_masonry.Clay(
+            length=1000,
+            height=2700,
+            thickness=110,
+            fuc=20,
+            mortar_class=3,
+            bedding_type=True,
+            verbose=False,
+        )
+
+        def fail():
+            raise AssertionError("report entered for a silent calculation")
+
+        monkeypatch.setattr(_util._print_handler, "report", fail)
+        wall.compression_capacity(
+            simple_av=1, kt=1, compression_load_type=1, verbose=False
+        )
+        wall._basic_compressive_capacity(False)
+
+    def test_reports_kept_apart_between_threads(self, monkeypatch):
+        """Walls reported from different threads each print their own report"""
+        printed = []
+        monkeypatch.setattr("builtins.print", printed.append)
+
+        def report(fuc):
+            wall = unreinforced_masonry.Clay(
+                length=1000,
+                height=2700,
+                thickness=110,
+                fuc=fuc,
+                mortar_class=3,
+                bedding_type=True,
+                verbose=False,
+            )
+            for _ in range(50):
+                wall.basic_compressive_capacity(verbose=True)
+
+        threads = [threading.Thread(target=report, args=(fuc,)) for fuc in (20, 30)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(printed) == 100
+        for output in printed:
+            assert output.count("basic_compressive_capacity = ") == 1
+
 
 class TestUnreinforcedMasonry:
 
@@ -0,0 +1,58 @@
+"""Contains tests for the vectorised unreinforced hollow concrete masonry calculations"""
+
+import itertools
+import numpy as np
+import toms_structures.unreinforced_masonry as unreinforced_masonry
+from toms_structures import batch
+
+
+class TestBatchBasicCompressiveCapacity:
+    """Tests that batch.basic_compressive_capacity matches the scalar method exactly"""
+
+    def test_matches_scalar(self):
+        """Sweep of thickness, bedding, raking, grouting and grout strength"""
+        cases = list(
+            itertools.product(
+                [140, 190],
+                [True, False],
+                [0, 5],
+                [0, 0.5, 1],
+                [15, 25],
+            )
+        )
+        fm = []
+        expected = []
+        for thickness, bedding_type, raking, grouted, fcg in cases:
+            wall = unreinforced_masonry.HollowConcrete(
+                length=1200,
+                height=2700,
+                thickness=thickness,
+                fuc=15,
+                mortar_class=3,
+                bedding_type=bedding_type,
+                raking=raking,
+                grouted=grouted,
+                fcg=fcg,
+                verbose=False,
+            )
+            expected.append(wall.basic_compressive_capacity(verbose=False))
+            fm.append(wall.fm)
+        thickness, bedding_type, raking, grouted, fcg = (
+            np.array(c) for c in zip(*cases)
+        )
+        result = batch.basic_compressive_capacity(
+            fm=np.array(fm),
+            length=1200,
+            thickness=thickness,
+            bedding_type=bedding_type,
+            face_shell_thickness=30,
+            raking=np.where(raking <= 3, 0, raking),
+            grouted=grouted,
+            lu=400,
+            fcg=fcg,
+            kc=wall._calc_kc(),
+            phi_compression=unreinforced_masonry.HollowConcrete._defaults[
+                "phi_compression"
+            ],
+        )
+        assert result.tolist() == expected
@@ -0,0 +1,189 @@
+"""Contains the numeric core of the AS3700:2018 calculations.
+
+These functions take plain floats, perform no validation and produce no output,
+so that they can be reused by the masonry classes and by the vectorised batch
+module without dragging attribute lookups and printing along. Where numba is
+installed (pip install toms_structures[jit]) refined_k_lateral is compiled; the
+JIT and plain Python results are checked to be bit-identical in the test suite.
+
+Scalar-only kernels use the math module, which is much faster than the NumPy
+ufuncs on single floats. Array equivalents belong in toms_structures.batch,
+which uses np.sqrt, np.minimum and friends.
+"""
+
+import functools
+import math
+from toms_structures._util import round_half_up
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to plain Python
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+
+# km keyed by (face shell bedding, mortar class), refer AS3700 Table 3.1
+_CLAY_KM = {(False, 2): 1.1, (False, 3): 1.4, (False, 4): 2, (True, 3): 1.6}
+_HOLLOW_CONCRETE_KM = {(True, 3): 1.6, (False, 3): 1.4}
+# kc for grout in clay masonry, refer AS3700 Cl 7.3.2
+_CLAY_KC = 1.2
+
+
+def _lookup_km(table: dict, bedding_type: bool, mortar_class: int) -> float:
+    try:
+        return table[(bedding_type is False, mortar_class)]
+    except (KeyError, TypeError):
+        if bedding_type is False:
+            raise ValueError(
+                "Face shell bedding_type is only available for mortar class M3."
+                " Change bedding_type or mortar_class"
+            ) from None
+        raise ValueError("Invalid mortar class provided") from None
+
+
+def clay_km(bedding_type: bool, mortar_class: int) -> float:
+    """Returns km for clay masonry, refer AS3700 Table 3.1"""
+    return _lookup_km(_CLAY_KM, bedding_type, mortar_class)
+
+
+def hollow_concrete_km(bedding_type: bool, mortar_class: int) -> float:
+    """Returns km for hollow concrete masonry, refer AS3700 Table 3.1"""
+    return _lookup_km(_HOLLOW_CONCRETE_KM, bedding_type, mortar_class)
+
+
+@functools.lru_cache(maxsize=64)
+def fm(
+    fuc: float, km: float, hu: float, tj: float, epsilon: int
+) -> tuple[float, float, float]:
+    """Returns (kh, fmb, fm) in accordance with AS3700 Cl 3.3.2
+
+    Cached, as the inputs rarely change between checks on the same wall
+    and the pow and sqrt dominate the cost."""
+    kh = round_half_up(min(1.3 * (hu / (19 * tj)) ** 0.29, 1.3), epsilon)
+    fmb = round_half_up(math.sqrt(fuc) * km, epsilon)
+    return kh, fmb, round_half_up(kh * fmb, epsilon)
+
+
+def refined_slenderness(
+    refined_av: float,
+    refined_ah: float,
+    kt: float,
+    height: float,
+    thickness: float,
+    dist_to_return: float | None,
+) -> tuple[float, float | None]:
+    """Returns the unrounded (vertical, horizontal) slenderness ratios, refer AS3700 Cl 7.3.4.3.
+    The horizontal ratio is None when there are no vertical lateral supports."""
+    sr_vertical = (refined_av * height) / (kt * thickness)
+    if refined_ah == 0:
+        return sr_vertical, None
+    sr_horizontal = (
+        0.7 / thickness * math.sqrt(refined_av * height * refined_ah * dist_to_return)
+    )
+    return sr_vertical, sr_horizontal
+
+
+@njit(cache=True)
+def refined_k_lateral(e1: float, e2: float, sr: float, thickness: float) -> float:
+    """Returns the unrounded k for lateral instability, refer AS3700 Cl 7.3.4.5(1)
+
+    Takes floats, or 1-D float64 arrays of equal length from the batch module.
+
+    The e1 / thickness terms are left as written in the standard, as regrouping
+    them as a ratio changes the last bit of some results."""
+    eccentricity_ratio = e2 / e1
+    sr_term_1 = 1.33 * sr - 8
+    sr_term_2 = 1.18 - 0.03 * sr
+    return (
+        0.5
+        * (1 + eccentricity_ratio)
+        * ((1 - 2.083 * e1 / thickness) - (0.025 - 0.037 * e1 / thickness) * sr_term_1)
+        + 0.5 * (1 - 0.6 * e1 / thickness) * (1 - eccentricity_ratio) * sr_term_2
+    )
+
+
+def effective_compression_length(
+    length: float, height: float, bearing_length: float, dist_to_end: float
+) -> float:
+    """Returns the length of wall the concentrated load disperses into, refer AS3700 Cl 7.3.5.4"""
+    half_height = height / 2
+    return min(
+        length,
+        min(dist_to_end, half_height)
+        + bearing_length
+        + min(half_height, length - dist_to_end - bearing_length),
+    )
+
+
+def kb(a1: float, bearing_area: float, dispersed_area: float, length: float) -> float:
+    """Returns the unrounded kb for full bedding, refer AS3700 Cl 7.3.5.4"""
+    kb_value = (
+        0.55 * (1 + 0.5 * a1 / length) / ((bearing_area / dispersed_area) ** 0.33)
+    )
+    return max(min(kb_value, 1.5 + a1 / length), 1)
+
+
+def self_weight(
+    density: float, length: float, height: float, thickness: float
+) -> float:
+    """Returns the self weight of the masonry, broadcasting elementwise for NumPy arrays"""
+    return density * length * height * thickness
+
+
+def vertical_bending(
+    phi: float, fmt: float, fd: float, zd: float
+) -> tuple[float, float]:
+    """Returns Mcv in Nmm from eq 7.4.2(2) and eq 7.4.2(3) of AS3700, applicable when fmt > 0"""
+    m_cv_1 = phi * fmt * zd + min(fd, 0.36) * zd
+    m_cv_2 = 3 * phi * fmt * zd
+    return m_cv_1, m_cv_2
+
+
+def horizontal_bending(
+    phi: float,
+    kp: float,
+    fmt: float,
+    fut: float,
+    fd: float,
+    zd: float,
+    zu: float,
+    zp: float,
+) -> tuple[float, float, float]:
+    """Returns Mch in KNm from eq 7.4.3.2(2), (3) and (4) of AS3700"""
+    sqrt_fmt = math.sqrt(fmt)
+    mch_1 = (2 * phi * kp * sqrt_fmt * (1 + fd / fmt) * zd) * 10**-6
+    mch_2 = 4 * phi * kp * sqrt_fmt * zd * 10**-6
+    mch_3 = phi * (0.44 * fut * zu + 0.56 * fmt * zp) * 10**-6
+    return mch_1, mch_2, mch_3
+
+
+def torsional_strength(fmt: float, fd: float) -> float:
+    """Returns the unrounded equivalent characteristic torsional strength, refer Cl 7.4.4.3"""
+    return 2.25 * math.sqrt(fmt) + 0.15 * fd
+
+
+def solid_zt(b: float, tu: float, lu: float, tj: float, crack_factor: float) -> float:
+    """Returns the unrounded lateral torsional section modulus Zt for solid units in mm3/m,
+    where crack_factor is sqrt(1 + G**2) for the crack slope G"""
+    numerator = 2 * (b * b) * (tu * tu)
+    # 3 * larger + 1.8 * smaller of B and tu
+    shape = 3 * max(b, tu) + 1.8 * min(b, tu)
+    return (numerator / shape) / ((lu + tj) * crack_factor) * 1e3
+
+
+def hollow_zt(
+    b: float, tu: float, lu: float, tj: float, ts: float, crack_factor: float
+) -> float:
+    """Returns the unrounded lateral torsional section modulus Zt for hollow units in mm3/m,
+    where crack_factor is sqrt(1 + G**2) for the crack slope G"""
+    return (
+        2
+        * b
+        * ts
+        * ((b * ts) / (1.5 * b + 0.9 * ts) + tu - ts)
+        / ((lu + tj) * crack_factor)
+    ) * 1e3
@@ -1,12 +1,31 @@
 # pylint: disable=too-many-lines
 """Contains methods for inheritance"""
 
-import math
 from abc import ABC, abstractmethod
-from toms_structures._util import round_half_up
+from dataclasses import dataclass, field
+from typing import ClassVar
+from toms_structures import _kernels
+from toms_structures._util import _round_factors, logger, reported, round_half_up
+
+# compression_load_type: (slope, pivot, cap, extra decimals) for k in the
+# simplified method, refer AS3700 Cl 7.3.3.3
+_K_COEFFS = {
+    1: (0.02, 14, 0.67, 0),
+    2: (0.025, 10, 0.67, 0),
+    3: (0.002, 14, 0.067, 1),
+}
+_K_LABELS = {
+    1: "Concrete slab over",
+    2: "Other systems (Table 7.1)",
+    3: "Load applied to face of wall (Table 7.1)",
+}
+
+# Number of refined compression results kept per wall, least recently used first out
+_REFINED_CACHE_SIZE = 8
 
 
 # pylint: disable=too-many-instance-attributes
+@dataclass(slots=True, eq=False)
 class _Masonry(ABC):
     """Abstract Base Class For the design of unreinforced masonry in accordance with AS3700:2018
 
@@ -67,105 +86,119 @@ class _Masonry(ABC):
 
     """
 
-    hu: float = 76
-    tj: float = 10
-    lu: float = 230
-    sp: float = 115
-    face_shell_thickness: float = 30
-    raking: float = 0
-    fmt: float = 0.2
-    fut: float = 0.8
-    phi_shear = 0.6
-    phi_bending = 0.6
-    phi_compression = 0.75
-    density = 19
-    grouted = 0
-    fcg = 15
-
-    def __init__(
-        self,
-        length: float,
-        height: float,
-        thickness: float,
-        fuc: float,
-        mortar_class: int,
-        bedding_type: bool = None,
-        verbose: bool = True,
-        hu: float = None,
-        tj: float = None,
-        lu: float = None,
-        tu: float = None,
-        sp: float = None,
-        face_shell_thickness: float = None,
-        raking: float = None,
-        fmt: float = None,
-        grouted: float = None,
-        fcg: float = None,
-    ):
-        self.epsilon = 2
-        self.length = length
-        self.height = height
-        self.thickness = thickness
-        self.fuc = fuc
-        self.mortar_class = mortar_class
-        self.bedding_type = (
-            bedding_type if bedding_type is not None else self.bedding_type
-        )
-        self.hu = hu if hu is not None else self.hu
-        self.tj = tj if tj is not None else self.tj
-        self.lu = lu if lu is not None else self.lu
-        self.tu = tu if tu is not None else self.thickness
-        self.sp = sp if sp is not None else round_half_up(self.lu / 2, self.epsilon)
-        self.fm = None
-        self.fmt = fmt if fmt is not None else self.fmt
-        self.verbose = verbose
-        self.fut = self.fut
-        self.phi_shear = self.phi_shear
-        self.phi_bending = self.phi_bending
-        self.phi_compression = self.phi_compression
-        self.density = self.density
-
-        self.grouted = self.grouted if grouted is not None else self.grouted
-        self.face_shell_thickness = (
-            face_shell_thickness
-            if face_shell_thickness is not None
-            else self.face_shell_thickness
-        )
-        self.raking = raking if raking is not None else self.raking
-        self.fcg = fcg if fcg is not None else self.fcg
-        self.__post_init__()
+    length: float
+    height: float
+    thickness: float
+    fuc: float
+    mortar_class: int
+    bedding_type: bool | None = None
+    verbose: bool = True
+    hu: float | None = None
+    tj: float | None = None
+    lu: float | None = None
+    tu: float | None = None
+    sp: float | None = None
+    face_shell_thickness: float | None = None
+    raking: float | None = None
+    fmt: float | None = None
+    grouted: float | None = None
+    fcg: float | None = None
+    fm: float | None = field(default=None, init=False)
+    _round_multiplier: int = field(init=False, repr=False)
+    _round_fudge: float = field(init=False, repr=False)
+    # (key, basic_comp_cap, fm) of the last basic compressive capacity
+    _basic_comp_cap_cache: tuple[tuple, float, float] | None = field(
+        default=None, init=False, repr=False
+    )
+    _refined_comp_cache: dict[tuple, dict] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    # Material constants, set per wall from _defaults so that they can be overridden
+    fut: float = field(init=False, repr=False)
+    phi_shear: float = field(init=False, repr=False)
+    phi_bending: float = field(init=False, repr=False)
+    phi_compression: float = field(init=False, repr=False)
+    density: float = field(init=False, repr=False)
+
+    epsilon: ClassVar[int] = 2
+    # Values used for the unit properties above when they are left as None,
+    # and for the material constants
+    _defaults: ClassVar[dict[str, float]] = {
+        "hu": 76,
+        "tj": 10,
+        "lu": 230,
+        "face_shell_thickness": 30,
+        "raking": 0,
+        "fmt": 0.2,
+        "grouted": 0,
+        "fcg": 15,
+        "fut": 0.8,
+        "phi_shear": 0.6,
+        "phi_bending": 0.6,
+        "phi_compression": 0.75,
+        "density": 19,
+    }
 
     def __post_init__(self):
+        if self.bedding_type is None:
+            raise ValueError(
+                "bedding_type not set, True for full bedding or "
+                "False for face shell bedding"
+            )
+        self._round_multiplier, self._round_fudge = _round_factors(self.epsilon)
+        for name, default in self._defaults.items():
+            if getattr(self, name, None) is None:
+                setattr(self, name, default)
+        if self.tu is None:
+            self.tu = self.thickness
+        if self.sp is None:
+            self.sp = self._round(self.lu / 2)
 
         if self.verbose:
-            print("Properties")
-            print("==========")
-            print(f"length: {self.length} mm")
-            print(f"height: {self.height} mm")
-            print(f"thickness: {self.thickness} mm")
-            print(
-                f"bedding_type: {'Full bedding' if
-                                    self.bedding_type is True else 'Face shell bedding'}"
+            logger.info("Properties")
+            logger.info("==========")
+            logger.info("length: %s mm", self.length)
+            logger.info("height: %s mm", self.height)
+            logger.info("thickness: %s mm", self.thickness)
+            logger.info(
+                "bedding_type: %s",
+                "Full bedding" if self.bedding_type is True else "Face shell bedding",
             )
-            print(f"mortar class: M{self.mortar_class}")
-            print(f"fuc: {self.fuc} MPa")
-            print(f"fmt: {self.fmt} MPa")
-            print(f"Masonry unit height hu: {self.hu} mm")
-            print(f"Masonry unit length lu: {self.lu} mm")
-            print(f"Masonry unit width tu: {self.tu} mm")
-            print(f"Joint thickness tj: {self.tj} mm")
-            print(f"Masonry unit overlap, sp: {self.sp} mm")
-            print(f"Face shell thickness, ts: {self.face_shell_thickness} mm")
+            logger.info("mortar class: M%s", self.mortar_class)
+            logger.info("fuc: %s MPa", self.fuc)
+            logger.info("fmt: %s MPa", self.fmt)
+            logger.info("Masonry unit height hu: %s mm", self.hu)
+            logger.info("Masonry unit length lu: %s mm", self.lu)
+            logger.info("Masonry unit width tu: %s mm", self.tu)
+            logger.info("Joint thickness tj: %s mm", self.tj)
+            logger.info("Masonry unit overlap, sp: %s mm", self.sp)
+            logger.info("Face shell thickness, ts: %s mm", self.face_shell_thickness)
         if self.raking <= 3:
             self.raking = 0
             if self.verbose:
-                print("Raking depth <= 3 mm, refer Cl 4.5.1 AS3700:2018")
+                logger.info("Raking depth <= 3 mm, refer Cl 4.5.1 AS3700:2018")
         if self.verbose:
-            print(f"Raking depth: {self.raking} mm")
+            logger.info("Raking depth: %s mm", self.raking)
 
             # km = self._calc_km(verbose=self.verbose)
             # masonry.calc_fm(self=self, km=km, verbose=self.verbose)
 
+    def _round(self, n: float) -> float:
+        """Equivalent to round_half_up(n, self.epsilon), using the multiplier and
+        fudge factor computed once in __post_init__.
+
+        Intermediate values such as kh, fmb, Sr and k are rounded before being
+        used further, as they would be in a hand calculation, so that results can
+        be checked line by line against the printed output."""
+        if n < 0:
+            raise ValueError(
+                "This function should not be used to round negative numbers"
+            )
+        multiplier = self._round_multiplier
+        return int(n * multiplier + 0.5 + self._round_fudge) / multiplier
+
+    @reported
     def _basic_compressive_capacity(self, verbose: bool = True) -> float:
         """Computes the Basic Compressive strength to AS3700 Cl 7.3.2(2)
         and returns the compressive capacity in KN. This does not account for
@@ -181,37 +214,65 @@ class _Masonry(ABC):
             basic compressive capacity in KN
 
         """
-        if verbose:
-            print("Basic Compressive Capacity, refer Cl 7.3.2(2) AS3700")
-            print("====================================================")
+        key = self._basic_compressive_capacity_key()
+        cached = self._basic_comp_cap_cache
+        if not verbose and cached is not None and cached[0] == key:
+            _, basic_comp_cap, self.fm = cached
+            return basic_comp_cap
+        if verbose:
+            logger.info("Basic Compressive Capacity, refer Cl 7.3.2(2) AS3700")
+            logger.info("====================================================")
         km = self._calc_km(verbose=verbose)
         self._calc_fm(km=km, verbose=verbose)
         bedded_area = self._calc_ab()
         if verbose:
-            print(f"bedded area Ab: {bedded_area} mm2")
+            logger.info("bedded area Ab: %s mm2", bedded_area)
         grouted_area = self._calc_ag()
         if verbose:
-            print(f"grouted area Ag: {grouted_area} mm2")
+            logger.info("grouted area Ag: %s mm2", grouted_area)
         kc = self._calc_kc()
-        basic_comp_cap = round_half_up(
+        basic_comp_cap = self._round(
             self.phi_compression
             * (
                 self.fm * bedded_area
                 + kc * (self.fcg / 1.3) ** (0.55 + 0.005 * self.fcg) * grouted_area
             )
             * 1e-3,
-            self.epsilon,
         )
         if verbose:
-            print(f"phi_compression: {self.phi_compression}")
-            print(f"basic_compressive_capacity = {basic_comp_cap} KN\n")
+            logger.info("phi_compression: %s", self.phi_compression)
+            logger.info("basic_compressive_capacity = %s KN\n", basic_comp_cap)
+        self._basic_comp_cap_cache = (key, basic_comp_cap, self.fm)
         return basic_comp_cap
 
+    def _basic_compressive_capacity_key(self) -> tuple:
+        """Returns the properties read by _basic_compressive_capacity, so that the
+        last result is only reused while none of them have changed"""
+        return (
+            self.length,
+            self.thickness,
+            self.fuc,
+            self.mortar_class,
+            self.bedding_type,
+            self.hu,
+            self.tj,
+            self.lu,
+            self.face_shell_thickness,
+            self.raking,
+            self.grouted,
+            self.fcg,
+            self.density,
+            self.phi_compression,
+            self.epsilon,
+        )
+
+    @reported
     def _compression_capacity(
         self,
         simple_av: float | None = None,
         kt: float | None = None,
         compression_load_type: int | None = None,
+        basic_comp_cap: float | None = None,
         verbose: bool = True,
     ) -> float:
         """
@@ -236,6 +297,9 @@ class _Masonry(ABC):
             2 - other systems (see Table 7.1)\n
             3 - wall with load applied to the face (see Table 7.1)
 
+        basic_comp_cap : float
+            Basic compressive capacity in KN, if already computed by the caller
+
         verbose : bool
             If True, print internal calculation details.
 
@@ -243,14 +307,16 @@ class _Masonry(ABC):
         -------
             A dictionary with crushing and buckling capacity in kN.
         """
-        if compression_load_type not in [1, 2, 3]:
+        try:
+            slope, pivot, cap, extra_decimals = _K_COEFFS[compression_load_type]
+        except (KeyError, TypeError):
             raise ValueError(
                 """compression_load_type undefined, refer AS 3700 Cl 7.3.3.3.
                     Options are:
                         1: concrete slab
                         2: other systems as defined in Table 7.1,
                         3: wall with load applied to the face as defined in Table 7.1"""
-            )
+            ) from None
         if simple_av is None:
             raise ValueError(
                 "simple_av undefined, refer AS 3700 Cl 7.3.3.4."
@@ -261,64 +327,44 @@ class _Masonry(ABC):
                 "kt undefined, refer AS 3700 Cl 7.3.4.2, set to 1 if there are no engaged piers"
             )
 
-        basic_comp_cap = self._basic_compressive_capacity(verbose)
+        if basic_comp_cap is None:
+            basic_comp_cap = self._basic_compressive_capacity(verbose)
         if verbose:
-            print("Compresion Capacity, refer Cl 7.3.3.3 AS3700")
-            print("============================================")
+            logger.info("Compresion Capacity, refer Cl 7.3.3.3 AS3700")
+            logger.info("============================================")
         srs = (simple_av * self.height) / (kt * self.thickness)
         if srs < 0:
             raise ValueError(
                 "Srs is negative, either decrease wall height or increase thickness"
             )
         if verbose:
-            print("Buckling capacity")
-            print("-----------------")
-            print(f"Srs = {simple_av} * {self.height} / {kt} * {self.thickness} ")
-            print(f"Srs = {srs:.2f} (Simplified slenderness ratio Cl 7.3.3.3)")
-
-        if compression_load_type == 1:
-            k = round_half_up(
-                min(0.67 - 0.02 * (srs - 14), 0.67),
-                self.epsilon,
+            logger.info("Buckling capacity")
+            logger.info("-----------------")
+            logger.info(
+                "Srs = %s * %s / %s * %s ", simple_av, self.height, kt, self.thickness
             )
-            if verbose:
-                print("Load type: Concrete slab over")
-                print(f"k = min(0.67 - 0.02 * ({srs:.2f} - 14), 0.67)")
-        elif compression_load_type == 2:
-            k = round_half_up(
-                min(
-                    0.67 - 0.025 * (srs - 10),
-                    0.67,
-                ),
-                self.epsilon,
-            )
-            if verbose:
-                print("Load type: Other systems (Table 7.1)")
-                print(f"k = min(0.67 - 0.025 * ({srs:.2f} - 10), 0.67)")
-        elif compression_load_type == 3:
-            k = round_half_up(
-                min(
-                    0.067 - 0.002 * (srs - 14),
-                    0.067,
-                ),
-                self.epsilon + 1,
+            logger.info("Srs = %.2f (Simplified slenderness ratio Cl 7.3.3.3)", srs)
+
+        k = round_half_up(
+            min(cap - slope * (srs - pivot), cap),
+            self.epsilon + extra_decimals,
+        )
+        if verbose:
+            logger.info("Load type: %s", _K_LABELS[compression_load_type])
+            logger.info(
+                "k = min(%s - %s * (%.2f - %s), %s)", cap, slope, srs, pivot, cap
             )
-            if verbose:
-                print("Load type: Load applied to face of wall (Table 7.1)")
-                print(f"k = min(0.067 - 0.002 * ({srs} - 14), 0.067)")
-        else:
-            raise ValueError("compression_load_type not in [1,2,3]")
 
-        simple_comp_cap = round_half_up(
+        simple_comp_cap = self._round(
             k * basic_comp_cap,
-            self.epsilon,
         )
         if verbose:
-            print(f"k = {k}")
-            print(f"Simple compression capacity kFo: {simple_comp_cap} KN\n")
+            logger.info("k = %s", k)
+            logger.info("Simple compression capacity kFo: %s KN\n", simple_comp_cap)
 
         return {"Simple": simple_comp_cap}
 
+    @reported
     def _refined_compression(
         self,
         refined_av: float,
@@ -328,6 +374,7 @@ class _Masonry(ABC):
         e2: float,
         dist_to_return: float | None = None,
         effective_length: float | None = None,
+        basic_comp_cap: float | None = None,
         verbose: bool = True,
     ) -> dict:
         """Computes the refined compressive capacity of a masonry wall per AS3700 Cl 7.3.
@@ -379,6 +426,9 @@ class _Masonry(ABC):
         effective_length : float
             Length of wall used in calculations in mm
 
+        basic_comp_cap : float
+            Basic compressive capacity in KN, if already computed by the caller
+
         verbose : bool
             Whether to print outputs.
 
@@ -390,17 +440,38 @@ class _Masonry(ABC):
             }
 
         """
-        basic_comp_cap = self._basic_compressive_capacity(verbose)
+        if basic_comp_cap is None:
+            basic_comp_cap = self._basic_compressive_capacity(verbose)
+
+        key = (
+            basic_comp_cap,
+            self.length,
+            self.height,
+            self.thickness,
+            self.epsilon,
+            refined_av,
+            refined_ah,
+            kt,
+            e1,
+            e2,
+            dist_to_return,
+            effective_length,
+        )
+        if not verbose and key in self._refined_comp_cache:
+            # Re-inserting moves the entry to the most recently used end
+            result = self._refined_comp_cache.pop(key)
+            self._refined_comp_cache[key] = result
+            return dict(result)
 
         if verbose:
-            print("Refined Compression Capacity, refer Cl 7.3 AS3700")
-            print("=================================================")
+            logger.info("Refined Compression Capacity, refer Cl 7.3 AS3700")
+            logger.info("=================================================")
 
         if effective_length is None:
             effective_length = self.length
         if verbose:
-            print(
-                f"effective length of wall used in calculation: {effective_length} mm"
+            logger.info(
+                "effective length of wall used in calculation: %s mm", effective_length
             )
 
         if e1 is None or e2 is None:
@@ -410,24 +481,22 @@ class _Masonry(ABC):
                 "e1 is the larger eccentricity of the vertical force"
             )
         if verbose:
-            print("\nCrushing capacity")
-            print("-----------------")
+            logger.info("\nCrushing capacity")
+            logger.info("-----------------")
         e1, e2 = self._calc_e1_e2(e1, e2, verbose)
-        k_local_crushing = round_half_up(
+        k_local_crushing = self._round(
             1 - 2 * e1 / self.thickness,
-            self.epsilon,
         )
-        crushing_comp_cap = round_half_up(
+        crushing_comp_cap = self._round(
             basic_comp_cap * k_local_crushing * (effective_length / self.length),
-            self.epsilon,
         )
         if verbose:
-            print(f"k (crushing): {k_local_crushing:.3f}")
-            print(f"crushing_compressive_capacity = {crushing_comp_cap} kN")
+            logger.info("k (crushing): %.3f", k_local_crushing)
+            logger.info("crushing_compressive_capacity = %s kN", crushing_comp_cap)
 
         if verbose:
-            print("\nBuckling capacity")
-            print("-----------------")
+            logger.info("\nBuckling capacity")
+            logger.info("-----------------")
         sr_vertical, sr_horizontal = self._calc_refined_slenderness(
             refined_ah=refined_ah,
             refined_av=refined_av,
@@ -436,7 +505,7 @@ class _Masonry(ABC):
             verbose=verbose,
         )
         if verbose:
-            print("Horizontal:")
+            logger.info("Horizontal:")
         k_lateral_horz = self._calc_refined_k_lateral(
             e1=e1,
             e2=e2,
@@ -446,12 +515,12 @@ class _Masonry(ABC):
         if k_lateral_horz > 0.2:
             k_lateral_horz = 0.2
             if verbose:
-                print(
+                logger.info(
                     "k_lateral_horz limited to 0.2 by 7.3.4.3(a) requirement of Fd < 0.2Fd"
                 )
 
         if verbose:
-            print("Vertical:")
+            logger.info("Vertical:")
         k_lateral_vert = self._calc_refined_k_lateral(
             e1=e1,
             e2=e2,
@@ -461,20 +530,24 @@ class _Masonry(ABC):
 
         k_lateral = max(k_lateral_horz, k_lateral_vert)
 
-        buckling_comp_cap = round_half_up(
+        buckling_comp_cap = self._round(
             basic_comp_cap * k_lateral * (effective_length / self.length),
-            self.epsilon,
         )
         if verbose:
-            print(f"k (buckling): {k_lateral}")
-            print(f"Effective length: {effective_length:.1f} mm")
-            print(f"kFo = {buckling_comp_cap} kN\n")
+            logger.info("k (buckling): %s", k_lateral)
+            logger.info("Effective length: %.1f mm", effective_length)
+            logger.info("kFo = %s kN\n", buckling_comp_cap)
 
-        return {
+        result = {
             "Crushing": crushing_comp_cap,
             "Buckling": buckling_comp_cap,
         }
+        if len(self._refined_comp_cache) >= _REFINED_CACHE_SIZE:
+            del self._refined_comp_cache[next(iter(self._refined_comp_cache))]
+        self._refined_comp_cache[key] = result
+        return dict(result)
 
+    @reported
     def _concentrated_load(
         self,
         simple_av: float | None = None,
@@ -532,19 +605,21 @@ class _Masonry(ABC):
                 "bearing_width not defined. Often this is the width of the wall."
             )
         if verbose:
-            print(f"bearing width: {bearing_width} mm")
-        print("WARNING: Test cases incomplete")
-        basic_comp_cap = self._basic_compressive_capacity(verbose=False)
+            logger.info("bearing width: %s mm", bearing_width)
+        if verbose:
+            logger.info("WARNING: Test cases incomplete")
 
         effective_length = self._calc_effective_compression_length(
             bearing_length=bearing_length,
             dist_to_end=dist_to_end,
             verbose=verbose,
         )
+        basic_comp_cap = self._basic_compressive_capacity(verbose)
         capacity = self._compression_capacity(
             simple_av=simple_av,
             kt=kt,
             compression_load_type=compression_load_type,
+            basic_comp_cap=basic_comp_cap,
             verbose=verbose,
         )
 
@@ -563,12 +638,13 @@ class _Masonry(ABC):
             * 1e-3
         )
         if verbose:
-            print(f"kbFo: {bearing_comp_cap} KN")
+            logger.info("kbFo: %s KN", bearing_comp_cap)
 
         capacity["Bearing"] = bearing_comp_cap
 
         return capacity
 
+    @reported
     def _refined_concentrated_load(
         self,
         refined_av: float | None = None,
@@ -650,14 +726,15 @@ class _Masonry(ABC):
                 "Bearing"
             }
         """
-        print("WARNING: Test cases incomplete")
-        basic_comp_cap = self._basic_compressive_capacity(verbose=False)
+        if verbose:
+            logger.info("WARNING: Test cases incomplete")
 
         effective_length = self._calc_effective_compression_length(
             bearing_length=bearing_length,
             dist_to_end=dist_to_end,
             verbose=verbose,
         )
+        basic_comp_cap = self._basic_compressive_capacity(verbose)
         capacity = self._refined_compression(
             refined_av=refined_av,
             refined_ah=refined_ah,
@@ -666,6 +743,7 @@ class _Masonry(ABC):
             e2=e2,
             dist_to_return=dist_to_return,
             effective_length=effective_length,
+            basic_comp_cap=basic_comp_cap,
             verbose=verbose,
         )
 
@@ -684,12 +762,13 @@ class _Masonry(ABC):
             * 1e-3
         )
         if verbose:
-            print(f"kbFo: {bearing_comp_cap} KN")
+            logger.info("kbFo: %s KN", bearing_comp_cap)
 
         capacity["Bearing"] = bearing_comp_cap
 
         return capacity
 
+    @reported
     def _vertical_bending(
         self,
         fd: float | None = None,
@@ -722,43 +801,53 @@ class _Masonry(ABC):
                 "at the cross section under consideration, in MPa"
             )
         if verbose:
-            print(f"fd: {fd} MPa")
+            logger.info("fd: %s MPa", fd)
         fmt = self._calc_fmt(interface=interface, verbose=verbose)
 
-        zd_vert = round_half_up(
-            self.length * self.thickness**2 / 6,
-            self.epsilon,
+        zd_vert = self._round(
+            self.length * (self.thickness * self.thickness) / 6,
         )
         if verbose:
-            print(f"Zd (horizontal plane): {zd_vert} mm3")
+            logger.info("Zd (horizontal plane): %s mm3", zd_vert)
 
         if fmt > 0:
-            m_cv_1 = self.phi_bending * fmt * zd_vert + min(fd, 0.36) * zd_vert
-            m_cv_2 = 3 * self.phi_bending * fmt * zd_vert
+            m_cv_1, m_cv_2 = _kernels.vertical_bending(
+                phi=self.phi_bending, fmt=fmt, fd=fd, zd=zd_vert
+            )
             m_cv = min(m_cv_1, m_cv_2)
             if verbose:
-                print(
-                    f"Mcv = {self.phi_bending} * {fmt} *"
-                    f"{zd_vert} + {min(fd,0.36)} = "
-                    f"{round_half_up(m_cv_1* 1e-6,self.epsilon)} KNm (7.4.2(2))"
+                logger.info(
+                    "Mcv = %s * %s *%s + %s = %s KNm (7.4.2(2))",
+                    self.phi_bending,
+                    fmt,
+                    zd_vert,
+                    min(fd, 0.36),
+                    self._round(m_cv_1 * 1e-6),
                 )
-                print(
-                    f"Mcv = 3 * {self.phi_bending} * {fmt} *"
-                    f" {zd_vert} = {round_half_up(m_cv_2* 1e-6,self.epsilon)} KNm (7.4.2(3))"
+                logger.info(
+                    "Mcv = 3 * %s * %s * %s = %s KNm (7.4.2(3))",
+                    self.phi_bending,
+                    fmt,
+                    zd_vert,
+                    self._round(m_cv_2 * 1e-6),
                 )
         else:
             m_cv = fd * zd_vert
             if verbose:
-                print(
-                    f"Mcv = fd Zd = {min(fd,0.36)} * {zd_vert} = {m_cv*1e-6} KNm (7.4.2(4))"
+                logger.info(
+                    "Mcv = fd Zd = %s * %s = %s KNm (7.4.2(4))",
+                    min(fd, 0.36),
+                    zd_vert,
+                    m_cv * 1e-6,
                 )
-        m_cv = round_half_up(m_cv * 1e-6, self.epsilon)
+        m_cv = self._round(m_cv * 1e-6)
         if verbose:
-            print("\nVertical bending capacity:")
-            print(f"Mcv = {m_cv} KNm for length of {self.length} mm")
-            print(f"Mcv = {m_cv/self.length*1e3} KNm/m")
+            logger.info("\nVertical bending capacity:")
+            logger.info("Mcv = %s KNm for length of %s mm", m_cv, self.length)
+            logger.info("Mcv = %s KNm/m", m_cv / self.length * 1e3)
         return m_cv
 
+    @reported
     def _horizontal_bending(
         self,
         fd: float | None = None,
@@ -786,15 +875,15 @@ class _Masonry(ABC):
             Horizontal bending capacity in KN : float
         """
         if verbose:
-            print("Horizontal Bending Capacity, refer Cl 7.4.3.2 AS3700")
-            print("====================================================")
+            logger.info("Horizontal Bending Capacity, refer Cl 7.4.3.2 AS3700")
+            logger.info("====================================================")
         if self.fmt is None:
             raise ValueError(
                 "self.fmt undefined.\n"
                 " set fmt = 0.2 under wind load, or 0 elsewhere, refer AS3700 Cl 3.3.3"
             )
         if verbose:
-            print(f"fmt: {self.fmt} MPa")
+            logger.info("fmt: %s MPa", self.fmt)
 
         if fd is None:
             raise ValueError(
@@ -802,7 +891,7 @@ class _Masonry(ABC):
                 "at the cross section under consideration, in MPa"
             )
         if verbose:
-            print(f"fd: {fd} MPa")
+            logger.info("fd: %s MPa", fd)
 
         kp = self._calc_kp(verbose=verbose)
 
@@ -811,56 +900,68 @@ class _Masonry(ABC):
         # The plane is normal to the direction under consideration
         zd_horz = self._calc_zd(horizontal=False, verbose=verbose)
         if verbose:
-            print(f"Zd (horizontal): {zd_horz} mm3\n")
+            logger.info("Zd (horizontal): %s mm3\n", zd_horz)
 
-        zu_horz = self.height * self.thickness**2 / 6
+        zu_horz = self.height * (self.thickness * self.thickness) / 6
         if verbose:
-            print(f"Zu (horizontal): {self.height} * {self.thickness}**2 / 6")
-            print(f"Zu (horizontal): {zu_horz} mm3\n")
+            logger.info("Zu (horizontal): %s * %s**2 / 6", self.height, self.thickness)
+            logger.info("Zu (horizontal): %s mm3\n", zu_horz)
 
         zp_horz = zd_horz
         if verbose:
-            print("Zp (horizontal) = Zu (horizontal)")
-            print(f"Zp (horizontal): {zp_horz} mm3\n")
-
-        mch_1 = (
-            2
-            * self.phi_shear
-            * kp
-            * math.sqrt(self.fmt)
-            * (1 + fd / self.fmt)
-            * zd_horz
-        ) * 10**-6
-        if verbose:
-            print(
-                f"Mch_1 = (2 * {self.phi_shear} * {kp} * math.sqrt({self.fmt}) * (1 + {fd} / {self.fmt}) * {zd_horz}) * 10**-6"
+            logger.info("Zp (horizontal) = Zu (horizontal)")
+            logger.info("Zp (horizontal): %s mm3\n", zp_horz)
+
+        mch_1, mch_2, mch_3 = _kernels.horizontal_bending(
+            phi=self.phi_shear,
+            kp=kp,
+            fmt=self.fmt,
+            fut=self.fut,
+            fd=fd,
+            zd=zd_horz,
+            zu=zu_horz,
+            zp=zp_horz,
+        )
+        if verbose:
+            logger.info(
+                "Mch_1 = (2 * %s * %s * math.sqrt(%s) * (1 + %s / %s) * %s) * 10**-6",
+                self.phi_shear,
+                kp,
+                self.fmt,
+                fd,
+                self.fmt,
+                zd_horz,
             )
-            print(f"Mch_1: {mch_1:.2f} KNm, refer AS3700 Cl 7.4.3.2(2)\n")
+            logger.info("Mch_1: %.2f KNm, refer AS3700 Cl 7.4.3.2(2)\n", mch_1)
 
-        mch_2 = 4 * self.phi_shear * kp * math.sqrt(self.fmt) * zd_horz * 10**-6
         if verbose:
-            print(
-                f"Mch_2 = 4 * {self.phi_shear} * {kp} * math.sqrt({self.fmt}) * {zd_horz} * 10**-6"
+            logger.info(
+                "Mch_2 = 4 * %s * %s * math.sqrt(%s) * %s * 10**-6",
+                self.phi_shear,
+                kp,
+                self.fmt,
+                zd_horz,
             )
-            print(f"Mch_2: {mch_2:.2f} KNm, refer AS3700 Cl 7.4.3.2(3)\n")
+            logger.info("Mch_2: %.2f KNm, refer AS3700 Cl 7.4.3.2(3)\n", mch_2)
 
-        mch_3 = (
-            self.phi_shear
-            * (0.44 * self.fut * zu_horz + 0.56 * self.fmt * zp_horz)
-            * 10**-6
-        )
         if verbose:
-            print(
-                f"Mch_3 = {self.phi_shear} * (0.44 * {self.fut} * {zu_horz} + 0.56 * {self.fmt} * {zp_horz}) * 10**-6"
+            logger.info(
+                "Mch_3 = %s * (0.44 * %s * %s + 0.56 * %s * %s) * 10**-6",
+                self.phi_shear,
+                self.fut,
+                zu_horz,
+                self.fmt,
+                zp_horz,
             )
-            print(f"Mch_3: {mch_3:.2f} KNm, refer AS3700 Cl 7.4.3.2(4)\n")
-        mch = round_half_up(min(mch_1, mch_2, mch_3), self.epsilon)
+            logger.info("Mch_3: %.2f KNm, refer AS3700 Cl 7.4.3.2(4)\n", mch_3)
+        mch = self._round(min(mch_1, mch_2, mch_3))
         if verbose:
-            print("Horizontal bending capacity:")
-            print(f"Mch: {mch} KNm for height of {self.height} mm")
-            print(f"Mch: {mch/self.height*1e3:.2f} KNm/m")
+            logger.info("Horizontal bending capacity:")
+            logger.info("Mch: %s KNm for height of %s mm", mch, self.height)
+            logger.info("Mch: %.2f KNm/m", mch / self.height * 1e3)
         return mch
 
+    @reported
     def _horizontal_plane_shear(
         self,
         kv: float,
@@ -897,45 +998,47 @@ class _Masonry(ABC):
         if kv > 0.3:
             raise ValueError("kv > 0.3 is outside the scope of AS3700")
         if verbose:
-            print(f"kv: {kv} (AS3700 T3.3)")
+            logger.info("kv: %s (AS3700 T3.3)", kv)
         fmt = self._calc_fmt(interface=interface, verbose=verbose)
 
         bedding_area = self.length * self.thickness
         fms_horizontal = self._calc_fms_horz(fmt=fmt, verbose=verbose)
 
-        v0 = round_half_up(
-            self.phi_shear * fms_horizontal * bedding_area * 1e-3, self.epsilon
-        )
+        v0 = self._round(self.phi_shear * fms_horizontal * bedding_area * 1e-3)
         if verbose:
-            print("\nV0: phi_shear * fms_horizontal * bedding_area")
-            print(f"V0: {self.phi_shear} * {fms_horizontal} * {bedding_area * 1e-3}")
-            print(f"V0: {v0} KN (bond strength)")
+            logger.info("\nV0: phi_shear * fms_horizontal * bedding_area")
+            logger.info(
+                "V0: %s * %s * %s", self.phi_shear, fms_horizontal, bedding_area * 1e-3
+            )
+            logger.info("V0: %s KN (bond strength)", v0)
         if verbose:
-            print(f"fd: {fd} MPa")
+            logger.info("fd: %s MPa", fd)
         if fd > 2:
             fd = 2
             if verbose:
-                print("fd limited to 2 MPa")
-        v1 = round_half_up(kv * fd * bedding_area * 1e-3, self.epsilon)
+                logger.info("fd limited to 2 MPa")
+        v1 = self._round(kv * fd * bedding_area * 1e-3)
         if verbose:
-            print("\nV1: kv * fd * bedding_area")
-            print(f"V1: {kv} * {fd} * {bedding_area * 1e-3}")
-            print(f"V1: {v1} KN (shear friction)")
+            logger.info("\nV1: kv * fd * bedding_area")
+            logger.info("V1: %s * %s * %s", kv, fd, bedding_area * 1e-3)
+            logger.info("V1: %s KN (shear friction)", v1)
         vd = v0 + v1
         if verbose:
-            print(f"V0 + V1: {vd} KN")
-            print(f"V0 + V1: {vd/self.length*1e3:.2f} KN/m")
+            logger.info("V0 + V1: %s KN", vd)
+            logger.info("V0 + V1: %.2f KN/m", vd / self.length * 1e3)
         return {"bond": v0, "friction": v1}
 
+    @reported
     def _vertical_plane_shear(self, verbose: bool = True) -> float:
         """Computes the horizontal shear capacity in accordance with AS3700 Cl 7.5.4.2"""
-        print("WARNING: Test cases incomplete")
+        if verbose:
+            logger.info("WARNING: Test cases incomplete")
         fms_vertical = self._calc_fms_vert(verbose=verbose)
         vertical_shear_cap = (
             self.phi_shear * fms_vertical * self.thickness * self.length
         )
         if verbose:
-            print(f"Vertical shear capacity: {vertical_shear_cap} KN")
+            logger.info("Vertical shear capacity: %s KN", vertical_shear_cap)
         return vertical_shear_cap
 
     def _calc_effective_compression_length(
@@ -954,17 +1057,14 @@ class _Masonry(ABC):
                 "the edge of the wall, refer AS3700 Cl 7.3.5.4."
             )
 
-        effective_length = min(
-            self.length,
-            min(dist_to_end, self.height / 2)
-            + bearing_length
-            + min(
-                self.height / 2,
-                self.length - dist_to_end - bearing_length,
-            ),
+        effective_length = _kernels.effective_compression_length(
+            length=self.length,
+            height=self.height,
+            bearing_length=bearing_length,
+            dist_to_end=dist_to_end,
         )
         if verbose:
-            print(f"effective wall length: {effective_length} mm")
+            logger.info("effective wall length: %s mm", effective_length)
 
         return effective_length
 
@@ -983,8 +1083,9 @@ class _Masonry(ABC):
                 "Change bedding_type or mortar_class"
             )
         elif verbose:
-            print(
-                f"bedding_type: {"Full" if self.bedding_type is True else "Face shell"}"
+            logger.info(
+                "bedding_type: %s",
+                "Full" if self.bedding_type is True else "Face shell",
             )
 
         if bearing_area is None:
@@ -993,28 +1094,31 @@ class _Masonry(ABC):
             )
         dispersed_area = effective_length * self.thickness
         if verbose:
-            print(f"dispersed area = {dispersed_area} mm2")
+            logger.info("dispersed area = %s mm2", dispersed_area)
         if self.bedding_type:
-            kb = (
-                0.55
-                * (1 + 0.5 * a1 / self.length)
-                / ((bearing_area / dispersed_area) ** 0.33)
+            kb = self._round(
+                _kernels.kb(
+                    a1=a1,
+                    bearing_area=bearing_area,
+                    dispersed_area=dispersed_area,
+                    length=self.length,
+                ),
             )
-            kb = min(kb, 1.5 + a1 / self.length)
-            kb = round_half_up(max(kb, 1), self.epsilon)
             if verbose:
-                print(
+                logger.info(
                     "kb = 0.55 * (1 + 0.5 * a1 / length) / "
                     "((bearing_area / dispersed_area) ** 0.33)"
                 )
-                print(
-                    f"kb = 0.55 * (1 + 0.5 * {a1} / {self.length}) / "
-                    "(({bearing_area} / {dispersed_area}) ** 0.33)"
+                logger.info(
+                    "kb = 0.55 * (1 + 0.5 * %s / %s) / "
+                    "(({bearing_area} / {dispersed_area}) ** 0.33)",
+                    a1,
+                    self.length,
                 )
         else:
             kb = 1
         if verbose:
-            print(f"kb: {kb}")
+            logger.info("kb: %s", kb)
 
         return kb
 
@@ -1033,13 +1137,16 @@ class _Masonry(ABC):
                 "positive and e2 negative"
             )
 
-        if abs(e1) < 0.05 * self.thickness:
-            e1 = 0.05 * self.thickness if e1 >= 0 else -0.05 * self.thickness
-        if abs(e2) < 0.05 * self.thickness:
-            e2 = 0.05 * self.thickness if e2 >= 0 else -0.05 * self.thickness
+        # e1 is non-negative here, so only e2 can take the minimum on either side
+        min_eccentricity = 0.05 * self.thickness
+        e1 = max(e1, min_eccentricity)
+        if abs(e2) < min_eccentricity:
+            e2 = min_eccentricity if e2 >= 0 else -min_eccentricity
         if verbose:
-            print(
-                f"End eccentricity, e1: {e1} mm, e2: {e2} mm, refer AS3700 Cl 7.3.4.4"
+            logger.info(
+                "End eccentricity, e1: %s mm, e2: %s mm, refer AS3700 Cl 7.3.4.4",
+                e1,
+                e2,
             )
         return e1, e2
 
@@ -1050,7 +1157,9 @@ class _Masonry(ABC):
         kt: float | None = None,
         dist_to_return: float | None = None,
         verbose: bool | None = True,
-    ) -> tuple[float, float]:
+    ) -> tuple[float, float | None]:
+        """Returns the vertical and horizontal slenderness ratios, refer AS3700 Cl 7.3.4.3.
+        The horizontal ratio is None when there are no vertical lateral supports."""
         if refined_av is None:
             raise ValueError(
                 "refined_av undefined, refer AS 3700 Cl 7.3.4.3. \n"
@@ -1064,7 +1173,7 @@ class _Masonry(ABC):
                 "2.5 for freestanding walls"
             )
         if verbose:
-            print(f"av: {refined_av}")
+            logger.info("av: %s", refined_av)
 
         if refined_ah is None:
             raise ValueError(
@@ -1073,14 +1182,14 @@ class _Masonry(ABC):
                 " 2.5 for one edge. If no vertical edges supported set as 0"
             )
         if verbose:
-            print(f"ah: {refined_ah}")
+            logger.info("ah: %s", refined_ah)
 
         if kt is None:
             raise ValueError(
                 "kt undefined, refer AS 3700 Cl 7.3.4.2, set to 1 if there are no engaged piers"
             )
         if verbose:
-            print(f"kt: {kt}")
+            logger.info("kt: %s", kt)
 
         if refined_ah != 0 and dist_to_return is None:
             raise ValueError(
@@ -1089,28 +1198,27 @@ class _Masonry(ABC):
                 "If both edges restrained, it is thedistance between return walls"
             )
         if dist_to_return is not None and verbose:
-            print(
-                f"distance to return wall or between lateral supports {dist_to_return} mm"
+            logger.info(
+                "distance to return wall or between lateral supports %s mm",
+                dist_to_return,
             )
 
-        sr_vertical = round_half_up(
-            (refined_av * self.height) / (kt * self.thickness),
-            self.epsilon,
+        sr_vertical, sr_horizontal = _kernels.refined_slenderness(
+            refined_av=refined_av,
+            refined_ah=refined_ah,
+            kt=kt,
+            height=self.height,
+            thickness=self.thickness,
+            dist_to_return=dist_to_return,
         )
+        sr_vertical = self._round(sr_vertical)
         if verbose:
-            print(f"Sr (vertical): {sr_vertical}")
-
-        sr_horizontal = float("inf")
+            logger.info("Sr (vertical): %s", sr_vertical)
 
-        if refined_ah != 0:
-            sr_horizontal = round_half_up(
-                0.7
-                / self.thickness
-                * math.sqrt(refined_av * self.height * refined_ah * dist_to_return),
-                self.epsilon,
-            )
-        if verbose:
-            print(f"Sr (horizontal) = {sr_horizontal}")
+        if sr_horizontal is not None:
+            sr_horizontal = self._round(sr_horizontal)
+            if verbose:
+                logger.info("Sr (horizontal) = %s", sr_horizontal)
 
         return sr_vertical, sr_horizontal
 
@@ -1121,28 +1229,39 @@ class _Masonry(ABC):
         sr: float | None = None,
         verbose=True,
     ) -> float:
-        """Calculates k for lateral instability in accordance with AS3700 Cl 7.3.4.5(1)"""
+        """Calculates k for lateral instability in accordance with AS3700 Cl 7.3.4.5(1),
+        which is 0 when sr is None as there is no lateral support in that direction"""
 
-        if sr == float("inf"):
+        if sr is None:
             k_lateral = 0
         else:
-            k_lateral = 0.5 * (1 + e2 / e1) * (
-                (1 - 2.083 * e1 / self.thickness)
-                - (0.025 - 0.037 * e1 / self.thickness) * (1.33 * sr - 8)
-            ) + 0.5 * (1 - 0.6 * e1 / self.thickness) * (1 - e2 / e1) * (
-                1.18 - 0.03 * sr
+            k_lateral = _kernels.refined_k_lateral(
+                e1=e1, e2=e2, sr=sr, thickness=self.thickness
             )
-        print(
-            f"k for lateral instability = 0.5 * (1 + {e2} / {e1}) * ( "
-            f" (1 - 2.083 * {e1} / {self.thickness}) "
-            f" - (0.025 - 0.037 * {e1} / {self.thickness}) * (1.33 * {sr} - 8) "
-            f") + 0.5 * (1 - 0.6 * {e1} / {self.thickness}) * (1 - {e2} / {e1}) * ("
-            f"   1.18 - 0.03 * {sr}"
-            " )"
-        )
-        k_lateral = round_half_up(max(k_lateral, 0), self.epsilon)
+            if verbose:
+                logger.info(
+                    "k for lateral instability = 0.5 * (1 + %s / %s) * ( "
+                    " (1 - 2.083 * %s / %s) "
+                    " - (0.025 - 0.037 * %s / %s) * (1.33 * %s - 8) "
+                    ") + 0.5 * (1 - 0.6 * %s / %s) * (1 - %s / %s) * ("
+                    "   1.18 - 0.03 * %s"
+                    " )",
+                    e2,
+                    e1,
+                    e1,
+                    self.thickness,
+                    e1,
+                    self.thickness,
+                    sr,
+                    e1,
+                    self.thickness,
+                    e2,
+                    e1,
+                    sr,
+                )
+        k_lateral = self._round(max(k_lateral, 0))
         if verbose:
-            print(f"k for lateral instability: {k_lateral}")
+            logger.info("k for lateral instability: %s", k_lateral)
         return k_lateral
 
     def _calc_kp(self, verbose: bool):
@@ -1150,13 +1269,14 @@ class _Masonry(ABC):
         kp2 = self.sp / self.hu
         kp3 = 1
         if verbose:
-            print("kp: min(sp/tu, sp/hu, 1), refer AS3700 Cl 7.4.3.4")
-            print(f"kp: min({kp1:.2f}, {kp2:.2f}, {kp3:.2f})")
-        kp = round_half_up(min(kp1, kp2, kp3), self.epsilon)
+            logger.info("kp: min(sp/tu, sp/hu, 1), refer AS3700 Cl 7.4.3.4")
+            logger.info("kp: min(%.2f, %.2f, %.2f)", kp1, kp2, kp3)
+        kp = self._round(min(kp1, kp2, kp3))
         if verbose:
-            print(f"kp: {kp}")
+            logger.info("kp: %s", kp)
         return kp
 
+    @reported
     def _two_way_bending(
         self,
         vert_supports: float,
@@ -1172,45 +1292,48 @@ class _Masonry(ABC):
             raise ValueError(
                 "Either 1 or 2 vertical edges must be supported for two_way bending"
             )
-        horz_capacity = round_half_up(
+        horz_capacity = self._round(
             self._horizontal_bending(fd=fd, interface=True, verbose=verbose)
             / self.height
             * 1e3,
-            self.epsilon,
         )
         if verbose:
-            print("\nDiagonal Bending Capacity, refer Cl 7.4.4.3 AS3700")
-            print("====================================================")
-        crack_slope = round_half_up(
-            2 * (self.hu + self.tj) / (self.lu + self.tj), self.epsilon
-        )
+            logger.info("\nDiagonal Bending Capacity, refer Cl 7.4.4.3 AS3700")
+            logger.info("====================================================")
+        crack_slope = self._round(2 * (self.hu + self.tj) / (self.lu + self.tj))
         if verbose:
-            print(
-                f"Assumed crack slope, G = 2 * ({self.hu} + {self.tj}) / ({self.lu} + {self.tj})"
+            logger.info(
+                "Assumed crack slope, G = 2 * (%s + %s) / (%s + %s)",
+                self.hu,
+                self.tj,
+                self.lu,
+                self.tj,
             )
 
         diag_capacity = self._diagonal_bending(
             fd=fd, crack_slope=crack_slope, verbose=verbose
         )
         if verbose:
-            print()
-            print("Two-Way Bending Capacity, refer Cl 7.4.4 AS3700")
-            print("====================================================")
-        design_length = round_half_up(self.length / vert_supports, self.epsilon)
+            logger.info("")
+            logger.info("Two-Way Bending Capacity, refer Cl 7.4.4 AS3700")
+            logger.info("====================================================")
+        design_length = self._round(self.length / vert_supports)
 
         if verbose:
-            print(f"design length, Ld: {design_length} mm")
+            logger.info("design length, Ld: %s mm", design_length)
 
         if top_support:
-            design_height = round_half_up(self.height / 2, self.epsilon)
+            design_height = self._round(self.height / 2)
         else:
             design_height = self.height
         if verbose:
-            print(f"Design height, Hd: {design_height} mm")
-        alpha = round_half_up(crack_slope * design_length / design_height, self.epsilon)
+            logger.info("Design height, Hd: %s mm", design_height)
+        alpha = self._round(crack_slope * design_length / design_height)
         if verbose:
-            print(f"alpha = {crack_slope} * {design_length} / {design_height}")
-            print(f"alpha: {alpha}")
+            logger.info(
+                "alpha = %s * %s / %s", crack_slope, design_length, design_height
+            )
+            logger.info("alpha: %s", alpha)
         af = self._calc_af(
             vert_supports,
             openings=openings,
@@ -1235,12 +1358,18 @@ class _Masonry(ABC):
             / (design_length**2 * 1e-6)
             * (k1 * horz_capacity + k2 * diag_capacity)
         )
-        two_way_capacity = round_half_up(two_way_capacity, self.epsilon)
-        if verbose:
-            print(
-                f"two_way_capacity = 2 * {af} / ({design_length}**2 * 1e-6) * ({k1} * {horz_capacity} + {k2} * {diag_capacity})"
+        two_way_capacity = self._round(two_way_capacity)
+        if verbose:
+            logger.info(
+                "two_way_capacity = 2 * %s / (%s**2 * 1e-6) * (%s * %s + %s * %s)",
+                af,
+                design_length,
+                k1,
+                horz_capacity,
+                k2,
+                diag_capacity,
             )
-            print(f"two-way capacity: {two_way_capacity} KPa")
+            logger.info("two-way capacity: %s KPa", two_way_capacity)
         return two_way_capacity
 
     def _calc_af(
@@ -1256,11 +1385,11 @@ class _Masonry(ABC):
             if alpha <= 1:
                 alpha_f = 1 / (1 - alpha / 3)
                 if verbose:
-                    print(f"alpha_f = 1 / (1 - {alpha} / 3)")
+                    logger.info("alpha_f = 1 / (1 - %s / 3)", alpha)
             elif alpha > 1:
                 alpha_f = alpha / (1 - 1 / (3 * alpha))
                 if verbose:
-                    print(f"alpha_f = {alpha} / (1 - 1 / (3 * {alpha}))")
+                    logger.info("alpha_f = %s / (1 - 1 / (3 * %s))", alpha, alpha)
             else:
                 raise ValueError("Configuration not valid for two-way bending")
         elif openings is True and vert_supports == 2:
@@ -1269,24 +1398,32 @@ class _Masonry(ABC):
                     (1 - alpha / 3) + opening_length / design_length * (1 - alpha / 2)
                 )
                 if verbose:
-                    print(
-                        f"alpha_f = 1 / ((1 - {alpha} / 3) + {opening_length} / {design_length} * (1 - {alpha} / 2))"
+                    logger.info(
+                        "alpha_f = 1 / ((1 - %s / 3) + %s / %s * (1 - %s / 2))",
+                        alpha,
+                        opening_length,
+                        design_length,
+                        alpha,
                     )
             elif alpha > 1:
                 alpha_f = alpha / (
                     (1 - 1 / (3 * alpha)) + opening_length / (2 * design_length)
                 )
                 if verbose:
-                    print(
-                        f"alpha_f = {alpha} / ((1 - 1 / (3 * {alpha})) + {opening_length} / (2 * {design_length}))"
+                    logger.info(
+                        "alpha_f = %s / ((1 - 1 / (3 * %s)) + %s / (2 * %s))",
+                        alpha,
+                        alpha,
+                        opening_length,
+                        design_length,
                     )
             else:
                 raise ValueError("Configuration not valid for two-way bending")
         else:
             raise ValueError("Configuration not valid for two-way bending")
-        alpha_f = round_half_up(alpha_f, self.epsilon)
+        alpha_f = self._round(alpha_f)
         if verbose:
-            print(f"alpha_f: {alpha_f}")
+            logger.info("alpha_f: %s", alpha_f)
         return alpha_f
 
     def _calc_k1(
@@ -1301,32 +1438,30 @@ class _Masonry(ABC):
         if openings is False and vert_supports == 2 and alpha <= 1:
             k1 = (rot_rest_1 + rot_rest_2) / 2 + 1 - alpha
             if verbose:
-                print(f"k1 = ({rot_rest_1} + {rot_rest_2}) / 2 + 1 - {alpha}")
+                logger.info(
+                    "k1 = (%s + %s) / 2 + 1 - %s", rot_rest_1, rot_rest_2, alpha
+                )
         elif openings is False and vert_supports == 2 and alpha < 1:
             k1 = (rot_rest_1 + rot_rest_2) / 2
             if verbose:
-                print(f"k1 = ({rot_rest_1} + {rot_rest_2}) / 2")
+                logger.info("k1 = (%s + %s) / 2", rot_rest_1, rot_rest_2)
         else:
             k1 = rot_rest_1
-        k1 = round_half_up(k1, self.epsilon)
+        k1 = self._round(k1)
         if verbose:
-            print(f"k1: {k1}")
+            logger.info("k1: %s", k1)
         return k1
 
     def _calc_k2(self, alpha: float, crack_slope: float, verbose: bool) -> float:
-        if alpha <= 1:
-            k2 = alpha * (1 + 1 / crack_slope**2)
-            if verbose:
-                print(f"k2 = {alpha} * (1 + 1 / {crack_slope}**2)")
-        else:
-            k2 = alpha * (1 + 1 / crack_slope**2)
-            if verbose:
-                print(f"k2 = {alpha} * (1 + 1 / {crack_slope}**2)")
-        k2 = round_half_up(k2, self.epsilon)
+        k2 = alpha * (1 + 1 / (crack_slope * crack_slope))
+        if verbose:
+            logger.info("k2 = %s * (1 + 1 / %s**2)", alpha, crack_slope)
+        k2 = self._round(k2)
         if verbose:
-            print(f"k2: {k2}")
+            logger.info("k2: %s", k2)
         return k2
 
+    @reported
     def _diagonal_bending(
         self, fd: float, crack_slope: float, verbose: bool = True
     ) -> float:
@@ -1357,19 +1492,17 @@ class _Masonry(ABC):
 
         zt = self._calc_zt(crack_slope=crack_slope, verbose=verbose)
         ft = self._calc_ft(fd=fd, verbose=verbose)
-        diagonal_bending_cap = round_half_up(
-            self.phi_bending * ft * zt * 10**-6, self.epsilon
-        )
+        diagonal_bending_cap = self._round(self.phi_bending * ft * zt * 10**-6)
         if verbose:
-            print(f"Mcd: {diagonal_bending_cap} KNm/m")
+            logger.info("Mcd: %s KNm/m", diagonal_bending_cap)
         return diagonal_bending_cap
 
     def _calc_ft(self, fd: float, verbose: bool = True) -> float:
         """Returns the equivalent characteristic torsional strength, refer Cl. 7.4.4.3"""
-        ft = round_half_up(2.25 * math.sqrt(self.fmt) + 0.15 * fd, self.epsilon)
+        ft = self._round(_kernels.torsional_strength(self.fmt, fd))
         if verbose:
-            print(f"2.25 * math.sqrt({self.fmt}) + 0.15 * {fd}")
-            print(f"f't: {ft} MPa, refer AS3700 Cl. 7.4.4.3")
+            logger.info("2.25 * math.sqrt(%s) + 0.15 * %s", self.fmt, fd)
+            logger.info("f't: %s MPa, refer AS3700 Cl. 7.4.4.3", ft)
         return ft
 
     @abstractmethod
@@ -1378,7 +1511,9 @@ class _Masonry(ABC):
 
     def _self_weight(self) -> float:
         """Returns the seld weight of the masonry, exlcuding any applied actions such as Fd."""
-        return self.density * self.length * self.height * self.thickness
+        return _kernels.self_weight(
+            self.density, self.length, self.height, self.thickness
+        )
 
     @abstractmethod
     def _calc_km(self, verbose: bool = True) -> float:
@@ -1387,13 +1522,13 @@ class _Masonry(ABC):
     def _calc_fms_horz(self, fmt: float, verbose: bool = True) -> float:
         fms_horizontal = max(0.15, min(1.25 * fmt, 0.35))
         if verbose:
-            print(f"f'ms (horizontal): {fms_horizontal} MPa")
+            logger.info("f'ms (horizontal): %s MPa", fms_horizontal)
         return fms_horizontal
 
     def _calc_fms_vert(self, verbose: bool = True) -> float:
         fms_vertical = max(0.15, min(1.25 * self.fm, 0.35))
         if verbose:
-            print(f"f'ms (vertical): {fms_vertical} MPa")
+            logger.info("f'ms (vertical): %s MPa", fms_vertical)
         return fms_vertical
 
     def _calc_fmt(
@@ -1415,9 +1550,10 @@ class _Masonry(ABC):
         else:
             raise ValueError("interface not bool")
         if verbose:
-            print(
-                f"fmt = {fmt} MPa (at interface with "
-                f"{"masonry" if interface else "other materials"})"
+            logger.info(
+                "fmt = %s MPa (at interface with %s)",
+                fmt,
+                "masonry" if interface else "other materials",
             )
         return fmt
 
@@ -1432,38 +1568,48 @@ class _Masonry(ABC):
         return bedded_area
 
     def _calc_zd(self, horizontal: bool, verbose: bool = True) -> float:
+        bedded_depth = self.thickness - 2 * self.raking
+        shell_depth = self.face_shell_thickness - self.raking
         # Horizontal
         if horizontal is True:
             if self.bedding_type is True:
-                zd = self.length * (self.thickness - 2 * self.raking) ** 2 / 6
+                zd = self.length * (bedded_depth * bedded_depth) / 6
                 if verbose:
-                    print(
-                        f"zd = {self.length} * ({self.thickness} - 2 * {self.raking}) ** 2 / 6"
+                    logger.info(
+                        "zd = %s * (%s - 2 * %s) ** 2 / 6",
+                        self.length,
+                        self.thickness,
+                        self.raking,
                     )
             elif self.bedding_type is False:
-                zd = (
-                    2 * self.length * (self.face_shell_thickness - self.raking) ** 2 / 6
-                )
+                zd = 2 * self.length * (shell_depth * shell_depth) / 6
                 if verbose:
-                    print(
-                        f"zd = (2 * {self.length} * ({self.face_shell_thickness} - {self.raking}) ** 2 / 6)"
+                    logger.info(
+                        "zd = (2 * %s * (%s - %s) ** 2 / 6)",
+                        self.length,
+                        self.face_shell_thickness,
+                        self.raking,
                     )
             else:
                 raise ValueError("bedding type not bool")
         elif horizontal is False:
             if self.bedding_type is True:
-                zd = (self.height) * (self.thickness - 2 * self.raking) ** 2 / 6
+                zd = (self.height) * (bedded_depth * bedded_depth) / 6
                 if verbose:
-                    print(
-                        f"zd = ({self.height}) * ({self.thickness} - 2 * {self.raking}) ** 2 / 6"
+                    logger.info(
+                        "zd = (%s) * (%s - 2 * %s) ** 2 / 6",
+                        self.height,
+                        self.thickness,
+                        self.raking,
                     )
             elif self.bedding_type is False:
-                zd = (
-                    2 * self.height * (self.face_shell_thickness - self.raking) ** 2 / 6
-                )
+                zd = 2 * self.height * (shell_depth * shell_depth) / 6
                 if verbose:
-                    print(
-                        f"zd = (2 * {self.height} * ({self.face_shell_thickness} - {self.raking}) ** 2 / 6)"
+                    logger.info(
+                        "zd = (2 * %s * (%s - %s) ** 2 / 6)",
+                        self.height,
+                        self.face_shell_thickness,
+                        self.raking,
                     )
             else:
                 raise ValueError("bedding type not bool")
@@ -1496,7 +1642,7 @@ class _Masonry(ABC):
         if km is None:
             raise ValueError("km not set.")
         elif verbose:
-            print(f"km: {km}")
+            logger.info("km: %s", km)
         if self.hu is not None and self.tj is None:
             raise ValueError(
                 "Masonry unit height provided but mortar thickness tj not provided"
@@ -1506,23 +1652,16 @@ class _Masonry(ABC):
                 "joint thickness tj provided but masonry unit height not provided"
             )
 
-        kh = round_half_up(
-            min(
-                1.3 * (self.hu / (19 * self.tj)) ** 0.29,
-                1.3,
-            ),
-            self.epsilon,
+        kh, fmb, self.fm = _kernels.fm(
+            fuc=self.fuc, km=km, hu=self.hu, tj=self.tj, epsilon=self.epsilon
         )
         if verbose:
-            print(
-                f"kh: {kh}, based on a masonry unit height of {self.hu} mm"
-                f" and a joint thickness of {self.tj} mm"
+            logger.info(
+                "kh: %s, based on a masonry unit height of %s mm"
+                " and a joint thickness of %s mm",
+                kh,
+                self.hu,
+                self.tj,
             )
-
-        fmb = round_half_up(math.sqrt(self.fuc) * km, self.epsilon)
-        if verbose:
-            print(f"fmb: {fmb} MPa")
-
-        self.fm = round_half_up(kh * fmb, self.epsilon)
-        if verbose:
-            print(f"fm: {self.fm} MPa")
+            logger.info("fmb: %s MPa", fmb)
+            logger.info("fm: %s MPa", self.fm)
@@ -1,12 +1,14 @@
 # pylint: disable=too-many-lines
 """Contains methods for inheritance"""
 
+from dataclasses import dataclass
 from toms_structures._masonry import _Masonry
-from toms_structures._util import round_half_up
+from toms_structures._util import logger
 
 
+@dataclass(slots=True, eq=False)
 class _ReinforcedMasonry(_Masonry):
-    bedding_type = False
+    bedding_type: bool | None = False
 
     def _reinforced_bending(
         self,
@@ -17,36 +19,37 @@ class _ReinforcedMasonry(_Masonry):
         verbose: bool = True,
     ):
         if verbose:
-            print("Bending capacity, refer Cl 8.6 AS3700")
-            print("=====================================")
+            logger.info("Bending capacity, refer Cl 8.6 AS3700")
+            logger.info("=====================================")
         km = self._calc_km(verbose=verbose)
         self._calc_fm(km=km, verbose=verbose)
         if verbose:
-            print(f"fsy: {fsy:.2f} MPa")
+            logger.info("fsy: %.2f MPa", fsy)
 
         if verbose:
-            print(f"d: {d:.2f} mm")
+            logger.info("d: %.2f mm", d)
 
         if verbose:
-            print(f"area_tension_steel: {area_tension_steel:.2f} mm2")
-            print(
-                f"Minimum quantity of secondary reinforcement: {0.00035*d * b:.2f} mm2, Cl 8.4.3"
+            logger.info("area_tension_steel: %.2f mm2", area_tension_steel)
+            logger.info(
+                "Minimum quantity of secondary reinforcement: %.2f mm2, Cl 8.4.3",
+                0.00035 * d * b,
             )
 
         if verbose:
-            print(f"b: {b:.2f} mm")
+            logger.info("b: %.2f mm", b)
 
         # Step 1: Calculate effective_area_tension_steel
         effective_area_tension_steel = min(
             area_tension_steel, (0.29 * 1.3 * self.fm * self.length * d) / fsy
         )
         if verbose is True:
-            print(
-                f"effective_area_tension_steel: {effective_area_tension_steel:.2f} mm2"
+            logger.info(
+                "effective_area_tension_steel: %.2f mm2", effective_area_tension_steel
             )
 
         # Step 2: Calculate moment_cap
-        moment_cap = round_half_up(
+        moment_cap = self._round(
             self.phi_bending
             * fsy
             * effective_area_tension_steel
@@ -57,8 +60,7 @@ class _ReinforcedMasonry(_Masonry):
                 / (1.3 * self.fm * self.length * d)
             )
             * 1e-6,
-            self.epsilon,
         )
         if verbose is True:
-            print(f"moment_cap: {moment_cap:.2f} KNm")
+            logger.info("moment_cap: %.2f KNm", moment_cap)
         return moment_cap
@@ -1,5 +1,9 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import logging
 import os
-import math
 import subprocess
 from datetime import datetime
 import ipynbname
@@ -7,6 +11,88 @@ import ipywidgets as widgets
 from IPython.display import display, clear_output
 from IPython.display import display, Markdown
 
+# Lines of the report in progress, held per thread and per asyncio task
+_report_buffer: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar(
+    "_report_buffer", default=None
+)
+
+
+class _PrintHandler(logging.Handler):
+    """Writes log records with print, so that output follows sys.stdout into
+    notebooks and captured test output"""
+
+    def emit(self, record):
+        try:
+            message = self.format(record)
+            buffer = _report_buffer.get()
+            if buffer is None:
+                print(message)
+            else:
+                buffer.append(message)
+        except Exception:
+            self.handleError(record)
+
+    @contextlib.contextmanager
+    def report(self):
+        """Collects records until the outermost report ends, then prints them
+        with a single call, as each print flushes in notebook front ends"""
+        if _report_buffer.get() is not None:
+            yield
+            return
+        lines = []
+        token = _report_buffer.set(lines)
+        try:
+            yield
+        finally:
+            _report_buffer.reset(token)
+            if lines:
+                print("\n".join(lines))
+
+
+# verbose=True output goes to stdout by default, so the library's own logger is set
+# to INFO. Propagation is left to the application: set logger.propagate = False if
+# your root handlers repeat the output, or call logger.removeHandler(_print_handler)
+# to route it through your own logging setup only
+logger = logging.getLogger("toms_structures")
+_print_handler = _PrintHandler()
+logger.addHandler(_print_handler)
+logger.setLevel(logging.INFO)
+
+
+def reported(method):
+    """Decorates a calculation so that its verbose output is printed in one go.
+    Calls with verbose=False, passed by keyword or position, skip the buffering
+    altogether."""
+    verbose_index = list(inspect.signature(method).parameters).index("verbose")
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if "verbose" in kwargs:
+            verbose = kwargs["verbose"]
+        elif len(args) > verbose_index:
+            verbose = args[verbose_index]
+        else:
+            verbose = True
+        if not verbose:
+            return method(*args, **kwargs)
+        with _print_handler.report():
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+# (multiplier, fudge factor) for round_half_up, keyed by the number of decimals
+_ROUND_TABLE = {d: (10**d, 10 ** -(d * 2)) for d in range(8)}
+
+
+def _round_factors(decimals):
+    """Returns (multiplier, fudge factor) for rounding to the given decimals,
+    which may be a NumPy array of decimals for the batch module"""
+    try:
+        return _ROUND_TABLE[decimals]
+    except (KeyError, TypeError):
+        return 10**decimals, 10.0 ** -(decimals * 2)
+
 
 def round_half_up(n, decimals=0):
     """
@@ -17,8 +103,9 @@ def round_half_up(n, decimals=0):
     """
     if n < 0:
         raise ValueError("This function should not be used to round negative numbers")
-    multiplier = 10**decimals
-    return math.floor(n * multiplier + 0.5 + 10 ** -(decimals * 2)) / multiplier
+    multiplier, fudge = _round_factors(decimals)
+    # int() truncates, which is the same as floor for the positive values allowed here
+    return int(n * multiplier + 0.5 + fudge) / multiplier
 
 
 def export_calc(output_dir, file_name):
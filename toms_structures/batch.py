@@ -0,0 +1,938 @@
+"""
+This module performs engineering calculations in accordance with
+AS3700:2018 for unreinforced masonry, vectorised over many walls or
+load cases at once. All parameters accept scalars or NumPy arrays, which
+are broadcast against each other.
+"""
+
+from dataclasses import dataclass, fields
+from typing import ClassVar
+import numpy as np
+from toms_structures import _kernels
+from toms_structures._masonry import _K_COEFFS
+from toms_structures._util import _round_factors
+from toms_structures.unreinforced_masonry import Clay
+
+# Row i holds the coefficients for compression_load_type i + 1
+_SIMPLE_K_COEFFS = np.array([_K_COEFFS[load_type] for load_type in (1, 2, 3)])
+
+
+def _bedding_type(bedding_type) -> np.ndarray:
+    """Returns bedding_type as a boolean array, rejecting None as the masonry
+    classes do rather than treating it as face shell bedding"""
+    bedding_type = np.asarray(bedding_type)
+    if bedding_type.dtype == object and any(
+        value is None for value in bedding_type.flat
+    ):
+        raise ValueError(
+            "bedding_type not set, True for full bedding or "
+            "False for face shell bedding"
+        )
+    return bedding_type.astype(bool)
+
+
+def _interface(interface) -> np.ndarray:
+    """Returns interface as a boolean array, rejecting None and other values
+    as the masonry classes do rather than relying on their truthiness"""
+    interface = np.asarray(interface)
+    if interface.dtype == object and any(value is None for value in interface.flat):
+        raise ValueError(
+            "interface not set, set to True if shear plane is masonry to masonry,"
+            " and False if shear_plane is masonry to other material"
+        )
+    if interface.dtype != bool:
+        raise ValueError("interface not bool")
+    return interface
+
+
+def _round_half_up(n, decimals=0):
+    """Array equivalent of toms_structures._util.round_half_up"""
+    n = np.asarray(n, dtype=float)
+    if np.any(n < 0):
+        raise ValueError("This function should not be used to round negative numbers")
+    multiplier, fudge = _round_factors(decimals)
+    return np.floor(n * multiplier + 0.5 + fudge) / multiplier
+
+
+def clay_km(bedding_type, mortar_class) -> np.ndarray:
+    """Returns km for clay masonry walls, refer AS3700 Table 3.1
+
+    Parameters
+    ----------
+
+    bedding_type : bool | np.ndarray
+        True if fully grout bedding,
+        False if face shell bedding
+
+    mortar_class : int | np.ndarray
+        Mortar class in accordance with AS3700
+
+    Returns
+    -------
+        km : np.ndarray
+    """
+    bedding_type = _bedding_type(bedding_type)
+    mortar_class = np.asarray(mortar_class)
+    km = np.select(
+        [
+            (~bedding_type == face_shell) & (mortar_class == key)
+            for face_shell, key in _kernels._CLAY_KM
+        ],
+        list(_kernels._CLAY_KM.values()),
+        np.nan,
+    )
+    invalid = np.isnan(km)
+    if np.any(invalid & ~bedding_type):
+        raise ValueError(
+            "Face shell bedding_type is only available for mortar class M3."
+            " Change bedding_type or mortar_class"
+        )
+    if np.any(invalid):
+        raise ValueError("Invalid mortar class provided")
+    return km
+
+
+def fm(fuc, km, hu, tj, epsilon: int = 2) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes kh, fmb and fm for masonry walls in accordance with AS3700 Cl 3.3.2.
+
+    Parameters
+    ----------
+
+    fuc : float | np.ndarray
+        unconfined compressive capacity in MPa
+
+    km : float | np.ndarray
+        mortar strength factor, refer AS3700 Table 3.1
+
+    hu : float | np.ndarray
+        masonry unit height in mm
+
+    tj : float | np.ndarray
+        grout thickness between masonry units in mm
+
+    epsilon : int
+        Number of decimal places results are rounded to
+
+    Returns
+    -------
+        (kh, fmb, fm) : tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    hu = np.asarray(hu, dtype=float)
+    kh = _round_half_up(np.minimum(1.3 * (hu / (19 * tj)) ** 0.29, 1.3), epsilon)
+    fmb = _round_half_up(np.sqrt(np.asarray(fuc, dtype=float)) * km, epsilon)
+    return kh, fmb, _round_half_up(kh * fmb, epsilon)
+
+
+def basic_compressive_capacity(
+    fm,
+    length,
+    thickness,
+    bedding_type,
+    face_shell_thickness=0,
+    raking=0,
+    grouted=0,
+    lu=230,
+    fcg=15,
+    kc=_kernels._CLAY_KC,
+    phi_compression: float = 0.75,
+    epsilon: int = 2,
+) -> np.ndarray:
+    """
+    Computes the basic compressive capacity Fo of masonry walls, refer AS3700 Cl 7.3.2(2).
+
+    Parameters
+    ----------
+
+    fm : float | np.ndarray
+        characteristic compressive strength of masonry in MPa, refer fm
+
+    length : float | np.ndarray
+        length of the wall in mm
+
+    thickness : float | np.ndarray
+        thickness of the wall in mm
+
+    bedding_type : bool | np.ndarray
+        True if fully grout bedding,
+        False if face shell bedding
+
+    face_shell_thickness : float | np.ndarray
+        masonry shell thickness in mm
+
+    raking : float | np.ndarray
+        depth of raking in mm, already set to 0 where 3 mm or less
+
+    grouted : float | np.ndarray
+        grouted proportion of the cores, 0 to 1
+
+    lu : float | np.ndarray
+        masonry unit length in mm
+
+    fcg : float | np.ndarray
+        grout compressive strength in MPa
+
+    kc : float | np.ndarray
+        strength factor for grout in compression, 1.2 for clay masonry
+
+    phi_compression : float
+        capacity reduction factor for compression
+
+    epsilon : int
+        Number of decimal places results are rounded to
+
+    Returns
+    -------
+        basic compressive capacity Fo in KN : np.ndarray
+    """
+    grouted = np.asarray(grouted, dtype=float)
+    if np.any((grouted < 0) | (grouted > 1)):
+        raise ValueError("grouted not between 0 and 1")
+    bedding_type = _bedding_type(bedding_type)
+    bedded_area = np.where(
+        bedding_type,
+        np.multiply(length, np.subtract(thickness, 2 * np.asarray(raking))),
+        2 * np.multiply(length, np.subtract(face_shell_thickness, raking)),
+    )
+    area_of_cell = (np.subtract(lu, 2 * np.asarray(face_shell_thickness))) * (
+        np.subtract(thickness, 2 * np.asarray(face_shell_thickness))
+    )
+    grouted_area = grouted * area_of_cell * (np.divide(length, lu))
+    fcg = np.asarray(fcg, dtype=float)
+    return _round_half_up(
+        phi_compression
+        * (fm * bedded_area + kc * (fcg / 1.3) ** (0.55 + 0.005 * fcg) * grouted_area)
+        * 1e-3,
+        epsilon,
+    )
+
+
+def compression_capacity(
+    basic_comp_cap,
+    height,
+    thickness,
+    simple_av,
+    kt,
+    compression_load_type,
+    epsilon: int = 2,
+) -> np.ndarray:
+    """
+    Computes the compression capacity of masonry walls using the simplified method in AS3700.
+
+    Parameters
+    ----------
+
+    basic_comp_cap : float | np.ndarray
+        Basic compressive capacity Fo in KN, refer AS3700 Cl 7.3.2(2)
+
+    height : float | np.ndarray
+        height of the wall in mm
+
+    thickness : float | np.ndarray
+        thickness of the wall in mm
+
+    simple_av : float | np.ndarray
+        Vertical slenderness coefficient\n
+        1 if the member is laterally supported along its top edge\n
+        2.5 if the member is not laterally supported along its top edge
+
+    kt : float | np.ndarray
+        a thickness coefficient derived from Table 7.2\n
+        1 - if there are no engaged piers
+
+    compression_load_type : int | np.ndarray
+        Type of compression loading:\n
+        1 - concrete slab\n
+        2 - other systems (see Table 7.1)\n
+        3 - wall with load applied to the face (see Table 7.1)
+
+    epsilon : int
+        Number of decimal places results are rounded to
+
+    Returns
+    -------
+        Simple compression capacity kFo in KN : np.ndarray
+    """
+    compression_load_type = np.asarray(compression_load_type)
+    if not np.all(np.isin(compression_load_type, tuple(_K_COEFFS))):
+        raise ValueError("compression_load_type not in [1,2,3]")
+    srs = (np.asarray(simple_av) * height) / (np.asarray(kt) * thickness)
+    if np.any(srs < 0):
+        raise ValueError(
+            "Srs is negative, either decrease wall height or increase thickness"
+        )
+    slope, pivot, cap, extra_decimals = np.moveaxis(
+        _SIMPLE_K_COEFFS[compression_load_type.astype(int) - 1], -1, 0
+    )
+    k = _round_half_up(
+        np.minimum(cap - slope * (srs - pivot), cap),
+        epsilon + extra_decimals.astype(int),
+    )
+    return _round_half_up(k * basic_comp_cap, epsilon)
+
+
+def vertical_bending(
+    fmt, fd, length, thickness, phi_bending: float = 0.6, epsilon: int = 2
+) -> np.ndarray:
+    """Computes the vertical bending capacity Mcv of masonry walls, refer AS3700 Cl 7.4.2.
+
+    Parameters
+    ----------
+
+    fmt : float | np.ndarray
+        Characteristic flexural tensile strength of masonry in MPa,
+        0 at an interface with other materials
+
+    fd : float | np.ndarray
+        The minimum design compressive stress on the bed joint at the
+        cross-section under consideration (see Clause 7.4.3.3), in MPa
+
+    length : float | np.ndarray
+        length of the wall in mm
+
+    thickness : float | np.ndarray
+        thickness of the wall in mm
+
+    phi_bending : float
+        capacity reduction factor for bending
+
+    epsilon : int
+        Number of decimal places results are rounded to
+
+    Returns
+    -------
+        Mcv in KNm : np.ndarray
+    """
+    fmt = np.asarray(fmt, dtype=float)
+    thickness = np.asarray(thickness, dtype=float)
+    zd = _round_half_up(np.multiply(length, thickness * thickness) / 6, epsilon)
+    m_cv = np.where(
+        fmt > 0,
+        np.minimum(
+            phi_bending * fmt * zd + np.minimum(fd, 0.36) * zd,
+            3 * phi_bending * fmt * zd,
+        ),
+        np.multiply(fd, zd),
+    )
+    return _round_half_up(m_cv * 1e-6, epsilon)
+
+
+def horizontal_bending(
+    fmt,
+    fd,
+    height,
+    thickness,
+    bedding_type,
+    kp,
+    face_shell_thickness=0,
+    raking=0,
+    fut: float = 0.8,
+    phi_shear: float = 0.6,
+    epsilon: int = 2,
+) -> np.ndarray:
+    """Computes the horizontal bending capacity Mch of masonry walls, refer AS3700 Cl 7.4.3.2.
+
+    Parameters
+    ----------
+
+    fmt : float | np.ndarray
+        Characteristic flexural tensile strength of masonry in MPa
+
+    fd : float | np.ndarray
+        The minimum design compressive stress on the bed joint at the
+        cross-section under consideration (see Clause 7.4.3.3), in MPa
+
+    height : float | np.ndarray
+        height of the wall in mm
+
+    thickness : float | np.ndarray
+        thickness of the wall in mm
+
+    bedding_type : bool | np.ndarray
+        True if fully grout bedding,
+        False if face shell bedding
+
+    kp : float | np.ndarray
+        perpend spacing factor, refer AS3700 Cl 7.4.3.4
+
+    face_shell_thickness : float | np.ndarray
+        masonry shell thickness in mm
+
+    raking : float | np.ndarray
+        depth of raking in mm, already set to 0 where 3 mm or less
+
+    fut : float
+        characteristic lateral modulus of rupture of the masonry units in MPa
+
+    phi_shear : float
+        capacity reduction factor, as used by the scalar calculation
+
+    epsilon : int
+        Number of decimal places results are rounded to
+
+    Returns
+    -------
+        Mch in KNm : np.ndarray
+    """
+    fmt = np.asarray(fmt, dtype=float)
+    if np.any(fmt <= 0):
+        raise ValueError("fmt must be greater than 0 for horizontal bending")
+    height = np.asarray(height, dtype=float)
+    thickness = np.asarray(thickness, dtype=float)
+    bedding_type = _bedding_type(bedding_type)
+    bedded_depth = thickness - 2 * np.asarray(raking)
+    shell_depth = np.subtract(face_shell_thickness, raking)
+    zd = np.where(
+        bedding_type,
+        height * (bedded_depth * bedded_depth) / 6,
+        2 * height * (shell_depth * shell_depth) / 6,
+    )
+    zu = height * (thickness * thickness) / 6
+    sqrt_fmt = np.sqrt(fmt)
+    mch_1 = (2 * phi_shear * kp * sqrt_fmt * (1 + fd / fmt) * zd) * 10**-6
+    mch_2 = 4 * phi_shear * kp * sqrt_fmt * zd * 10**-6
+    mch_3 = phi_shear * (0.44 * fut * zu + 0.56 * fmt * zd) * 10**-6
+    return _round_half_up(np.minimum(np.minimum(mch_1, mch_2), mch_3), epsilon)
+
+
+def refined_slenderness(
+    height,
+    thickness,
+    refined_av,
+    refined_ah,
+    kt,
+    dist_to_return=None,
+    epsilon: int = 2,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Computes the vertical and horizontal slenderness ratios, refer AS3700 Cl 7.3.4.3.
+
+    Parameters
+    ----------
+
+    height : float | np.ndarray
+        height of the wall in mm
+
+    thickness : float | np.ndarray
+        thickness of the wall in mm
+
+    refined_av : float | np.ndarray
+        Vertical slenderness coefficient, refer AS 3700 Cl 7.3.4.3.
+
+    refined_ah : float | np.ndarray
+        Horizontal slenderness coefficient, 0 for a wall with no lateral supports,
+        refer Figure 7.2 AS3700
+
+    kt : float | np.ndarray
+        A thickness coefficient derived from Table 7.2
+
+    dist_to_return : float | np.ndarray | None
+        Distance to return wall in mm, only used where refined_ah is not 0.
+        None and NaN mark walls without a return wall
+
+    epsilon : int
+        Number of decimal places results are rounded to
+
+    Returns
+    -------
+        (sr_vertical, sr_horizontal) : tuple[np.ndarray, np.ndarray]
+        sr_horizontal is NaN where refined_ah is 0
+    """
+    refined_av = np.asarray(refined_av, dtype=float)
+    refined_ah = np.asarray(refined_ah, dtype=float)
+    supported = refined_ah != 0
+    dist_to_return = np.where(supported, np.asarray(dist_to_return, dtype=float), 0)
+    if np.any(np.isnan(dist_to_return)):
+        raise ValueError(
+            "dist_to_return undefined. "
+            "For one edge restrained, this is the distance to the return wall. "
+            "If both edges restrained, it is thedistance between return walls"
+        )
+    sr_vertical = _round_half_up(
+        (refined_av * height) / (np.asarray(kt) * thickness), epsilon
+    )
+    sr_horizontal = _round_half_up(
+        0.7 / thickness * np.sqrt(refined_av * height * refined_ah * dist_to_return),
+        epsilon,
+    )
+    return sr_vertical, np.where(supported, sr_horizontal, np.nan)
+
+
+def refined_k_lateral(e1, e2, sr, thickness, epsilon: int = 2) -> np.ndarray:
+    """Computes k for lateral instability, refer AS3700 Cl 7.3.4.5(1).
+
+    e1 and e2 should already be limited to 0.05 * thickness as in AS3700 Cl 7.3.4.4.
+    k is 0 where sr is NaN, as there is no lateral support in that direction.
+
+    Parameters
+    ----------
+
+    e1 : float | np.ndarray
+        The larger eccentricity of the vertical force in mm
+
+    e2 : float | np.ndarray
+        The smaller eccentricity of the vertical force in mm
+
+    sr : float | np.ndarray
+        slenderness ratio
+
+    thickness : float | np.ndarray
+        thickness of the wall in mm
+
+    epsilon : int
+        Number of decimal places results are rounded to
+
+    Returns
+    -------
+        k for lateral instability : np.ndarray
+    """
+    sr = np.asarray(sr, dtype=float)
+    unsupported = np.isnan(sr)
+    # The kernel may be compiled by numba, so it is given flat float64 arrays of
+    # one shape rather than a mix of scalars and arrays of different dtypes
+    e1, e2, sr, thickness = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=float)
+            for value in (e1, e2, np.where(unsupported, 0, sr), thickness)
+        )
+    )
+    k_lateral = _kernels.refined_k_lateral(
+        *(np.ascontiguousarray(value).ravel() for value in (e1, e2, sr, thickness))
+    ).reshape(sr.shape)
+    return np.where(unsupported, 0, _round_half_up(np.maximum(k_lateral, 0), epsilon))
+
+
+def effective_compression_length(
+    length, height, bearing_length, dist_to_end
+) -> np.ndarray:
+    """Computes the length of wall a concentrated load disperses into,
+    refer AS3700 Cl 7.3.5.4.
+
+    Parameters
+    ----------
+
+    length : float | np.ndarray
+        length of the wall in mm
+
+    height : float | np.ndarray
+        height of the wall in mm
+
+    bearing_length : float | np.ndarray
+        length of the bearing area in mm
+
+    dist_to_end : float | np.ndarray
+        shortest distance from the edge of the bearing area to the edge of the wall in mm
+
+    Returns
+    -------
+        effective length of each wall in mm : np.ndarray
+    """
+    half_height = np.asarray(height, dtype=float) / 2
+    return np.minimum(
+        length,
+        np.minimum(dist_to_end, half_height)
+        + bearing_length
+        + np.minimum(half_height, np.subtract(length, dist_to_end) - bearing_length),
+    )
+
+
+def refined_compression(
+    basic_comp_cap,
+    length,
+    height,
+    thickness,
+    refined_av,
+    refined_ah,
+    kt,
+    e1,
+    e2,
+    dist_to_return=np.nan,
+    effective_length=None,
+    epsilon: int = 2,
+) -> dict:
+    """Computes the refined compressive capacity of masonry walls per AS3700 Cl 7.3.
+
+    Parameters
+    ----------
+
+    basic_comp_cap : float | np.ndarray
+        Basic compressive capacity Fo in KN, refer AS3700 Cl 7.3.2(2)
+
+    length : float | np.ndarray
+        length of the wall in mm
+
+    height : float | np.ndarray
+        height of the wall in mm
+
+    thickness : float | np.ndarray
+        thickness of the wall in mm
+
+    refined_av : float | np.ndarray
+        Vertical slenderness coefficient, refer AS 3700 Cl 7.3.4.3.
+
+    refined_ah : float | np.ndarray
+        Horizontal slenderness coefficient, 0 for a wall with no lateral supports,
+        refer Figure 7.2 AS3700
+
+    kt : float | np.ndarray
+        A thickness coefficient derived from Table 7.2
+
+    e1 : float | np.ndarray
+        The larger eccentricity of the vertical force in mm
+
+    e2 : float | np.ndarray
+        The smaller eccentricity of the vertical force in mm, negative when the
+        eccentricities are on opposite sides of the member
+
+    dist_to_return : float | np.ndarray | None
+        Distance to return wall in mm, only used where refined_ah is not 0.
+        None and NaN mark walls without a return wall
+
+    effective_length : float | np.ndarray
+        Length of wall used in calculations in mm, defaults to length
+
+    epsilon : int
+        Number of decimal places results are rounded to
+
+    Returns
+    -------
+        dict: {
+            'Crushing': np.ndarray,
+            'Buckling': np.ndarray,
+        }
+    """
+    if effective_length is None:
+        effective_length = length
+    length_ratio = np.asarray(effective_length) / length
+    thickness = np.asarray(thickness, dtype=float)
+    e1 = np.asarray(e1, dtype=float)
+    e2 = np.asarray(e2, dtype=float)
+    if np.any(e1 < e2):
+        raise ValueError("e1 set to a value less than e2")
+    if np.any(e1 < 0):
+        raise ValueError(
+            "e1 < 0. e1 should always be positive by defintion "
+            "refer AS3700:2018 Cl 7.3.4.5."
+        )
+    min_eccentricity = 0.05 * thickness
+    e1 = np.where(np.abs(e1) < min_eccentricity, min_eccentricity, e1)
+    e2 = np.where(
+        np.abs(e2) < min_eccentricity,
+        np.where(e2 >= 0, min_eccentricity, -min_eccentricity),
+        e2,
+    )
+
+    k_local_crushing = _round_half_up(1 - 2 * e1 / thickness, epsilon)
+    crushing_comp_cap = _round_half_up(
+        basic_comp_cap * k_local_crushing * length_ratio, epsilon
+    )
+
+    sr_vertical, sr_horizontal = refined_slenderness(
+        height=height,
+        thickness=thickness,
+        refined_av=refined_av,
+        refined_ah=refined_ah,
+        kt=kt,
+        dist_to_return=dist_to_return,
+        epsilon=epsilon,
+    )
+    k_lateral_horz = refined_k_lateral(
+        e1=e1, e2=e2, sr=sr_horizontal, thickness=thickness, epsilon=epsilon
+    )
+    k_lateral_horz = np.minimum(k_lateral_horz, 0.2)
+    k_lateral_vert = refined_k_lateral(
+        e1=e1, e2=e2, sr=sr_vertical, thickness=thickness, epsilon=epsilon
+    )
+    k_lateral = np.maximum(k_lateral_horz, k_lateral_vert)
+    buckling_comp_cap = _round_half_up(
+        basic_comp_cap * k_lateral * length_ratio, epsilon
+    )
+    return {
+        "Crushing": crushing_comp_cap,
+        "Buckling": buckling_comp_cap,
+    }
+
+
+def self_weight(density, length, height, thickness) -> np.ndarray:
+    """Returns the self weight of masonry walls, excluding any applied actions such as Fd.
+
+    Parameters
+    ----------
+
+    density : float | np.ndarray
+        density of the masonry
+
+    length : float | np.ndarray
+        length of the wall in mm
+
+    height : float | np.ndarray
+        height of the wall in mm
+
+    thickness : float | np.ndarray
+        thickness of the wall in mm
+
+    Returns
+    -------
+        self weight of each wall : np.ndarray
+    """
+    return np.asarray(
+        _kernels.self_weight(
+            np.asarray(density, dtype=float), length, height, thickness
+        )
+    )
+
+
+@dataclass(eq=False)
+class ClayBatch:
+    """Clay masonry walls stored as one NumPy array per property, so that a
+    whole schedule of walls is checked with a single call per capacity.
+    Properties broadcast against each other, and each method returns arrays
+    that match Clay exactly wall by wall.
+
+    Parameters
+    ----------
+
+        length : float | np.ndarray
+            length of the wall in mm
+
+        height : float | np.ndarray
+            height of the wall in mm
+
+        thickness : float | np.ndarray
+            thickness of the wall in mm
+
+        fuc : float | np.ndarray
+            unconfined compressive capacity in MPa
+
+        mortar_class : int | np.ndarray
+            Mortar class in accordance with AS3700
+
+        bedding_type : bool | np.ndarray
+            True if fully grout bedding,
+            False if face shell bedding
+
+        hu : float | np.ndarray
+            masonry unit height in mm, defaults to 76 mm
+
+        tj : float | np.ndarray
+            grout thickness between masonry units in mm, defaults to 10 mm
+
+        lu : float | np.ndarray
+            masonry unit length in mm, defaults to 230 mm
+
+        tu : float | np.ndarray
+            masonry unit width in mm, defaults to the thickness
+
+        sp : float | np.ndarray
+            masonry unit overlap in mm, defaults to half the unit length
+
+        face_shell_thickness : float | np.ndarray
+            masonry shell thickness in mm, defaults to 0 mm
+
+        raking : float | np.ndarray
+            depth of raking in mm, defaults to 0 mm
+
+        fmt : float | np.ndarray
+            Characteristic flexural tensile strength of masonry in MPa, defaults to 0.2 MPa
+
+        grouted : bool | np.ndarray
+            True if the cores are grouted, defaults to False
+
+        fcg : float | np.ndarray
+            grout compressive strength in MPa, defaults to 15 MPa
+
+    """
+
+    length: np.ndarray
+    height: np.ndarray
+    thickness: np.ndarray
+    fuc: np.ndarray
+    mortar_class: np.ndarray
+    bedding_type: np.ndarray
+    hu: np.ndarray = 76
+    tj: np.ndarray = 10
+    lu: np.ndarray = 230
+    tu: np.ndarray | None = None
+    sp: np.ndarray | None = None
+    face_shell_thickness: np.ndarray = 0
+    raking: np.ndarray = 0
+    fmt: np.ndarray = 0.2
+    grouted: np.ndarray = False
+    fcg: np.ndarray = 15
+
+    fut: ClassVar[float] = Clay._defaults["fut"]
+    phi_shear: ClassVar[float] = Clay._defaults["phi_shear"]
+    phi_bending: ClassVar[float] = Clay._defaults["phi_bending"]
+    phi_compression: ClassVar[float] = Clay._defaults["phi_compression"]
+    density: ClassVar[float] = Clay._defaults["density"]
+    epsilon: ClassVar[int] = Clay.epsilon
+
+    def __post_init__(self):
+        if self.tu is None:
+            self.tu = self.thickness
+        if self.sp is None:
+            self.sp = _round_half_up(np.divide(self.lu, 2), self.epsilon)
+        for field in fields(self):
+            setattr(self, field.name, np.asarray(getattr(self, field.name)))
+        self.bedding_type = _bedding_type(self.bedding_type)
+        # Raking of 3 mm or less is ignored, refer Cl 4.5.1 AS3700:2018
+        self.raking = np.where(self.raking <= 3, 0, self.raking)
+
+    @classmethod
+    def from_walls(cls, walls: list[Clay]) -> "ClayBatch":
+        """Collects the properties of existing Clay walls into a ClayBatch,
+        with one entry per wall in the order given"""
+        for wall in walls:
+            if not isinstance(wall, Clay):
+                raise TypeError(
+                    f"ClayBatch.from_walls takes Clay walls, got {type(wall).__name__}"
+                )
+        return cls(
+            **{
+                field.name: np.array([getattr(wall, field.name) for wall in walls])
+                for field in fields(cls)
+            }
+        )
+
+    def basic_compressive_capacity(self) -> np.ndarray:
+        """Computes the Basic Compressive strength to AS3700 Cl 7.3.2(2).
+
+        Returns
+        -------
+            basic compressive capacity of each wall in KN : np.ndarray
+        """
+        _, _, fm_value = fm(
+            fuc=self.fuc,
+            km=clay_km(self.bedding_type, self.mortar_class),
+            hu=self.hu,
+            tj=self.tj,
+            epsilon=self.epsilon,
+        )
+        return basic_compressive_capacity(
+            fm=fm_value,
+            length=self.length,
+            thickness=self.thickness,
+            bedding_type=self.bedding_type,
+            face_shell_thickness=self.face_shell_thickness,
+            raking=self.raking,
+            grouted=self.grouted,
+            lu=self.lu,
+            fcg=self.fcg,
+            kc=_kernels._CLAY_KC,
+            phi_compression=self.phi_compression,
+            epsilon=self.epsilon,
+        )
+
+    def compression_capacity(self, simple_av, kt, compression_load_type) -> np.ndarray:
+        """Computes the compression capacity of each wall using the simplified method,
+        refer compression_capacity for the parameters.
+
+        Returns
+        -------
+            Simple compression capacity kFo in KN : np.ndarray
+        """
+        return compression_capacity(
+            basic_comp_cap=self.basic_compressive_capacity(),
+            height=self.height,
+            thickness=self.thickness,
+            simple_av=simple_av,
+            kt=kt,
+            compression_load_type=compression_load_type,
+            epsilon=self.epsilon,
+        )
+
+    def refined_compression(
+        self, refined_av, refined_ah, kt, e1, e2, dist_to_return=np.nan
+    ) -> dict:
+        """Computes the refined compressive capacity of each wall per AS3700 Cl 7.3,
+        refer refined_compression for the parameters.
+
+        Returns
+        -------
+            dict: {
+                'Crushing': np.ndarray,
+                'Buckling': np.ndarray,
+            }
+        """
+        return refined_compression(
+            basic_comp_cap=self.basic_compressive_capacity(),
+            length=self.length,
+            height=self.height,
+            thickness=self.thickness,
+            refined_av=refined_av,
+            refined_ah=refined_ah,
+            kt=kt,
+            e1=e1,
+            e2=e2,
+            dist_to_return=dist_to_return,
+            epsilon=self.epsilon,
+        )
+
+    def _calc_kp(self) -> np.ndarray:
+        return _round_half_up(
+            np.minimum(np.minimum(self.sp / self.tu, self.sp / self.hu), 1),
+            self.epsilon,
+        )
+
+    def vertical_bending(self, fd, interface) -> np.ndarray:
+        """Computes the vertical bending capacity of each wall, refer AS 3700 Cl 7.4.2.
+
+        Parameters
+        ----------
+
+        fd : float | np.ndarray
+            The minimum design compressive stress on the bed joint at the
+            cross-section under consideration (see Clause 7.4.3.3), in MPa
+
+        interface : bool | np.ndarray
+            True if shear plane is masonry to masonry,
+            and False if shear_plane is masonry to other material
+
+        Returns
+        -------
+            Mcv in KNm : np.ndarray
+        """
+        return vertical_bending(
+            fmt=np.where(_interface(interface), self.fmt, 0),
+            fd=fd,
+            length=self.length,
+            thickness=self.thickness,
+            phi_bending=self.phi_bending,
+            epsilon=self.epsilon,
+        )
+
+    def horizontal_bending(self, fd) -> np.ndarray:
+        """Computes the horizontal bending capacity of each wall, refer AS3700 Cl 7.4.3.2.
+
+        Parameters
+        ----------
+
+        fd : float | np.ndarray
+            The minimum design compressive stress on the bed joint at the
+            cross-section under consideration (see Clause 7.4.3.3), in MPa
+
+        Returns
+        -------
+            Mch in KNm : np.ndarray
+        """
+        return horizontal_bending(
+            fmt=self.fmt,
+            fd=fd,
+            height=self.height,
+            thickness=self.thickness,
+            bedding_type=self.bedding_type,
+            kp=self._calc_kp(),
+            face_shell_thickness=self.face_shell_thickness,
+            raking=self.raking,
+            fut=self.fut,
+            phi_shear=self.phi_shear,
+            epsilon=self.epsilon,
+        )
+
+    def self_weight(self) -> np.ndarray:
+        """Returns the self weight of each wall, excluding any applied actions such as Fd"""
+        return self_weight(
+            density=self.density,
+            length=self.length,
+            height=self.height,
+            thickness=self.thickness,
+        )
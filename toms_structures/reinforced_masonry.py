@@ -3,9 +3,13 @@ This module performs engineering calculations in accordance with
 AS3700:2018 for reinforced masonry
 """
 
+from dataclasses import dataclass
+from typing import ClassVar
 from toms_structures._reinforced_masonry import _ReinforcedMasonry
+from toms_structures._util import logger
 
 
+@dataclass(slots=True, eq=False)
 class HollowConcrete(_ReinforcedMasonry):
     """For the design of reinforced block masonry in accordance with AS3700:2018
 
@@ -48,20 +52,22 @@ class HollowConcrete(_ReinforcedMasonry):
 
     """
 
-    hu: float = 200
-    tj: float = 10
-    lu: float = 400
-    ts: float = 140
-    face_shell_thickness: float = 10
-    raking: float = 0
-    fmt: float = 0.2
-    fut: float = 0.8
-    phi_shear: float = 0.75
-    phi_bending: float = 0.75
-    phi_compression: float = 0.75
-    density: float = 19
-    grouted: float = 0
-    fcg: float = 15
+    ts: ClassVar[float] = 140
+    _defaults: ClassVar[dict[str, float]] = {
+        "hu": 200,
+        "tj": 10,
+        "lu": 400,
+        "face_shell_thickness": 10,
+        "raking": 0,
+        "fmt": 0.2,
+        "grouted": 0,
+        "fcg": 15,
+        "fut": 0.8,
+        "phi_shear": 0.75,
+        "phi_bending": 0.75,
+        "phi_compression": 0.75,
+        "density": 19,
+    }
 
     def out_of_plane_vertical_bending(
         self,
@@ -223,9 +229,9 @@ class HollowConcrete(_ReinforcedMasonry):
     def _calc_km(self, verbose: bool = True) -> float:
         km = 1.6
         if verbose:
-            print("Mortar class M3")
-            print("Bedding type: Face shell")
-            print(f"km: {km}")
+            logger.info("Mortar class M3")
+            logger.info("Bedding type: Face shell")
+            logger.info("km: %s", km)
         return km
 
     def _calc_kc(self) -> float:
@@ -4,10 +4,14 @@ AS3700:2018 for unreinforced masonry
 """
 
 import math
+from dataclasses import dataclass
+from typing import ClassVar
+from toms_structures import _kernels
 from toms_structures._masonry import _Masonry
-from toms_structures._util import round_half_up
+from toms_structures._util import logger
 
 
+@dataclass(slots=True, eq=False)
 class Clay(_Masonry):
     """Clay Masonry object
 
@@ -55,19 +59,21 @@ class Clay(_Masonry):
 
     """
 
-    hu: float = 76
-    tj: float = 10
-    lu: float = 230
-    face_shell_thickness: float = 0
-    raking: float = 0
-    fmt: float = 0.2
-    fut: float = 0.8
-    phi_shear: float = 0.6
-    phi_bending: float = 0.6
-    phi_compression: float = 0.75
-    density: float = 19
-    grouted: bool = False
-    fcg: float = 15
+    _defaults: ClassVar[dict[str, float]] = {
+        "hu": 76,
+        "tj": 10,
+        "lu": 230,
+        "face_shell_thickness": 0,
+        "raking": 0,
+        "fmt": 0.2,
+        "grouted": False,
+        "fcg": 15,
+        "fut": 0.8,
+        "phi_shear": 0.6,
+        "phi_bending": 0.6,
+        "phi_compression": 0.75,
+        "density": 19,
+    }
 
     def basic_compressive_capacity(self, verbose: bool = True) -> float:
         """Computes the Basic Compressive strength to AS3700 Cl 7.3.2(2)
@@ -538,69 +544,42 @@ class Clay(_Masonry):
                 "fuc undefined, for new structures the value is typically 20 MPa,"
                 " and for existing 10 to 12MPa"
             )
-        if self.bedding_type is None:
-            raise ValueError(
-                "bedding_type not set. set to True for Full bedding or False for Face shell bedding"
-            )
-        if self.bedding_type is False and self.mortar_class != 3:
-            raise ValueError(
-                "Face shell bedding_type is only available for mortar class M3."
-                " Change bedding_type or mortar_class"
-            )
         if verbose:
-            print(
-                f"bedding_type: {"Full" if self.bedding_type is True else "Face shell"}"
+            logger.info(
+                "bedding_type: %s",
+                "Full" if self.bedding_type is True else "Face shell",
             )
 
         if self.mortar_class is None:
             raise ValueError("mortar_class undefined, typically 3")
 
-        if self.bedding_type is False:
-            km = 1.6
-        elif self.mortar_class == 4:
-            km = 2
-        elif self.mortar_class == 3:
-            km = 1.4
-        elif self.mortar_class == 2:
-            km = 1.1
-        else:
-            raise ValueError("Invalid mortar class provided")
-        return km
+        return _kernels.clay_km(self.bedding_type, self.mortar_class)
 
     def _calc_kc(self):
-        return 1.2
+        return _kernels._CLAY_KC
 
     def _calc_zt(self, crack_slope: float, verbose: bool = True):
 
         if verbose:
-            print(f"Assumed crack slope, G: {crack_slope}")
+            logger.info("Assumed crack slope, G: %s", crack_slope)
 
-        b = round_half_up(
-            (self.hu + self.tj) / math.sqrt(1 + crack_slope**2), self.epsilon
-        )
+        crack_factor = math.sqrt(1 + crack_slope * crack_slope)
+        b = self._round((self.hu + self.tj) / crack_factor)
         if verbose:
-            print(f"B: {b}")
-
-        if b >= self.tu:
-            zt = (
-                ((2 * b**2 * self.tu**2) / (3 * b + 1.8 * self.tu))
-                / ((self.lu + self.tj) * math.sqrt(1 + crack_slope**2))
-                * 1e3
-            )
+            logger.info("B: %s", b)
 
-        else:
-            zt = (
-                ((2 * b**2 * self.tu**2) / (3 * self.tu + 1.8 * b))
-                / ((self.lu + self.tj) * math.sqrt(1 + crack_slope**2))
-                * 1e3
-            )
-        zt = round_half_up(zt, self.epsilon)
+        zt = self._round(
+            _kernels.solid_zt(
+                b=b, tu=self.tu, lu=self.lu, tj=self.tj, crack_factor=crack_factor
+            ),
+        )
 
         if verbose:
-            print(f"Zt: {zt} mm3")
+            logger.info("Zt: %s mm3", zt)
         return zt
 
 
+@dataclass(slots=True, eq=False)
 class HollowConcrete(_Masonry):
     """Concrete Masonry object
 
@@ -649,19 +628,21 @@ class HollowConcrete(_Masonry):
 
     """
 
-    hu: float = 200
-    tj: float = 10
-    lu: float = 400
-    tu: float = 140
-    face_shell_thickness: float = 30
-    raking: float = 0
-    fmt: float = 0.2
-    fut: float = 0.8
-    phi_shear: float = 0.6
-    phi_bending: float = 0.6
-    phi_compression: float = 0.6
-    density: float = 19
-    fcg: float = 15
+    _defaults: ClassVar[dict[str, float]] = {
+        "hu": 200,
+        "tj": 10,
+        "lu": 400,
+        "face_shell_thickness": 30,
+        "raking": 0,
+        "fmt": 0.2,
+        "grouted": 0,
+        "fcg": 15,
+        "fut": 0.8,
+        "phi_shear": 0.6,
+        "phi_bending": 0.6,
+        "phi_compression": 0.6,
+        "density": 19,
+    }
 
     def basic_compressive_capacity(self, verbose: bool = True) -> float:
         """Computes the Basic Compressive strength to AS3700 Cl 7.3.2(2)
@@ -1131,27 +1112,13 @@ class HollowConcrete(_Masonry):
         return self._vertical_plane_shear(verbose=verbose)
 
     def _calc_km(self, verbose: bool = True) -> float:
-        if self.bedding_type is None:
-            raise ValueError(
-                "bedding_type not set. set to True for Full bedding or False for Face shell bedding"
-            )
-        if self.bedding_type is False and self.mortar_class != 3:
-            raise ValueError(
-                "Face shell bedding_type is only available for mortar class M3."
-                " Change bedding_type or mortar_class"
-            )
         if verbose:
-            print(
-                f"bedding_type: {"Full" if self.bedding_type is True else "Face shell"}"
+            logger.info(
+                "bedding_type: %s",
+                "Full" if self.bedding_type is True else "Face shell",
             )
 
-        if self.bedding_type is False and self.mortar_class == 3:
-            km = 1.6
-        elif self.mortar_class == 3:
-            km = 1.4
-        else:
-            raise ValueError("Invalid mortar class provided")
-        return km
+        return _kernels.hollow_concrete_km(self.bedding_type, self.mortar_class)
 
     def _calc_kc(self) -> float:
         if self.density > 20:
@@ -1162,45 +1129,33 @@ class HollowConcrete(_Masonry):
     def _calc_zt(self, crack_slope: float, verbose: bool = True):
 
         if verbose:
-            print(f"Assumed crack slope, G: {crack_slope}")
+            logger.info("Assumed crack slope, G: %s", crack_slope)
 
-        b = round_half_up(
-            (self.hu + self.tj) / math.sqrt(1 + crack_slope**2), self.epsilon
-        )
+        crack_factor = math.sqrt(1 + crack_slope * crack_slope)
+        b = self._round((self.hu + self.tj) / crack_factor)
         if verbose:
-            print(f"B: ({self.hu} + {self.tj}) / math.sqrt(1 + {crack_slope}**2)")
-            print(f"B: {b}")
+            logger.info(
+                "B: (%s + %s) / math.sqrt(1 + %s**2)", self.hu, self.tj, crack_slope
+            )
+            logger.info("B: %s", b)
 
         if self.grouted < 1:
             if verbose:
-                print("section not fully grouted, treating as hollow")
-
-            zt = (
-                2
-                * b
-                * self.face_shell_thickness
-                * (
-                    (b * self.face_shell_thickness)
-                    / (1.5 * b + 0.9 * self.face_shell_thickness)
-                    + self.tu
-                    - self.face_shell_thickness
-                )
-                / ((self.lu + self.tj) * math.sqrt(1 + crack_slope**2))
-            ) * 1e3
-        elif b >= self.tu:
-            zt = (
-                ((2 * b**2 * self.tu**2) / (3 * b + 1.8 * self.tu))
-                / ((self.lu + self.tj) * math.sqrt(1 + crack_slope**2))
-                * 1e3
+                logger.info("section not fully grouted, treating as hollow")
+
+            zt = _kernels.hollow_zt(
+                b=b,
+                tu=self.tu,
+                lu=self.lu,
+                tj=self.tj,
+                ts=self.face_shell_thickness,
+                crack_factor=crack_factor,
             )
-
         else:
-            zt = (
-                ((2 * b**2 * self.tu**2) / (3 * self.tu + 1.8 * b))
-                / ((self.lu + self.tj) * math.sqrt(1 + crack_slope**2))
-                * 1e3
+            zt = _kernels.solid_zt(
+                b=b, tu=self.tu, lu=self.lu, tj=self.tj, crack_factor=crack_factor
             )
-        zt = round_half_up(zt, self.epsilon)
+        zt = self._round(zt)
         if verbose:
-            print(f"Zt: {zt} mm3")
+            logger.info("Zt: %s mm3", zt)
         return zt